@@ -1,8 +1,24 @@
 import sys
 import math
 import time
-from multiprocessing import Pool, cpu_count
-from sympy import isprime
+import threading
+from multiprocessing import Pool, Queue, cpu_count
+
+def _qr_mask(m):
+    """Máscara de bits de los residuos cuadráticos módulo m."""
+    mask = 0
+    for i in range(m):
+        mask |= 1 << ((i * i) % m)
+    return mask
+
+# Filtros de cuadrado perfecto: un cuadrado debe ser residuo en los tres módulos.
+# Solo ~1% de los no-cuadrados supera la cadena y llega a math.isqrt.
+QR64 = _qr_mask(64)
+QR63 = _qr_mask(63)
+QR65 = _qr_mask(65)
+
+# Discriminantes de calibración x^2 - 4 (x = 3..102): no dependen de n
+DISCS = tuple((k + 3) * (k + 3) - 4 for k in range(100))
 
 class PureGraphEngine:
     """
@@ -13,57 +29,85 @@ class PureGraphEngine:
 
     @staticmethod
     def _jacobi(a, n):
-        """Jacobi Bitwise."""
+        """
+        Jacobi Binario.
+        Los factores de 2 se extraen de un solo golpe y todos los signos
+        salen de los bits bajos de a y n (sin comparaciones por bit).
+        """
         if a == 0: return 0
         if a == 1: return 1
         a %= n
         t = 1
-        while a != 0:
-            while (a & 1) == 0:
-                a >>= 1
-                if (n & 7) in (3, 5): t = -t
-            a, n = n, a
-            if (a & 3) == 3 and (n & 3) == 3: t = -t
-            a %= n
+        while a:
+            # Ceros finales de a: (2/n)^tz, solo cuenta la paridad de tz
+            tz = (a & -a).bit_length() - 1
+            a >>= tz
+            if tz & 1 and (n & 7) in (3, 5): t = -t
+            # Reciprocidad: se invierte si a = n = 3 (mod 4)
+            if a & n & 2: t = -t
+            a, n = n % a, a
         return t if n == 1 else 0
 
     @staticmethod
     def _mat_mul(A, B, n):
         """
         Producto Tensorial de Grafos (Composición).
+        Las matrices viajan como 4-tuplas (a, b, c, d): sin listas intermedias.
         """
-        # A, B = [a, b, c, d]
-        return [
-            (A[0]*B[0] + A[1]*B[2]) % n,
-            (A[0]*B[1] + A[1]*B[3]) % n,
-            (A[2]*B[0] + A[3]*B[2]) % n,
-            (A[2]*B[1] + A[3]*B[3]) % n
-        ]
+        a, b, c, d = A
+        e, f, g, h = B
+        return (
+            (a*e + b*g) % n,
+            (a*f + b*h) % n,
+            (c*e + d*g) % n,
+            (c*f + d*h) % n
+        )
 
     @staticmethod
     def _mat_sq(A, n):
-        """Iteración del Grafo."""
+        """
+        Iteración del Grafo.
+        Reducción perezosa: b*c se suma sin reducir y cada entrada paga
+        un único % n.
+        """
         # A^2 optimizado
         a, b, c, d = A
-        bc = (b * c) % n
-        return [
+        bc = b * c
+        ad = a + d
+        return (
             (a*a + bc) % n,
-            (b * (a + d)) % n,
-            (c * (a + d)) % n,
+            (b * ad) % n,
+            (c * ad) % n,
             (d*d + bc) % n
-        ]
+        )
 
     @staticmethod
     def _mat_pow(A, exp, n):
-        """Evolución Topológica."""
-        res = [1, 0, 0, 1] # Identidad
-        base = A
-        while exp > 0:
-            if exp & 1:
-                res = PureGraphEngine._mat_mul(res, base, n)
-            base = PureGraphEngine._mat_sq(base, n)
-            exp >>= 1
-        return res
+        """
+        Evolución Topológica.
+        Exponenciación binaria de izquierda a derecha: se recorre el
+        exponente desde su bit alto, elevando al cuadrado el acumulado y
+        multiplicando por A (fija) solo en los bits a 1. No hay cuadrados
+        inútiles tras el bit alto.
+        Kernel escalar: producto y cuadrado desplegados sobre locales.
+        """
+        if exp <= 0:
+            return (1, 0, 0, 1) # Identidad
+        a0, a1, a2, a3 = A
+        # El bit alto siempre es 1: el acumulado arranca en A
+        r0, r1, r2, r3 = a0 % n, a1 % n, a2 % n, a3 % n
+        for bit in range(exp.bit_length() - 2, -1, -1):
+            bc = r1 * r2
+            ad = r0 + r3
+            r0, r1, r2, r3 = (r0*r0 + bc) % n, (r1*ad) % n, (r2*ad) % n, (r3*r3 + bc) % n
+            if (exp >> bit) & 1:
+                r0, r1, r2, r3 = (
+                    (r0*a0 + r1*a2) % n,
+                    (r0*a1 + r1*a3) % n,
+                    (r2*a0 + r3*a2) % n,
+                    (r2*a1 + r3*a3) % n
+                )
+        return (r0, r1, r2, r3)
 
     @staticmethod
     def analyze_graph(n):
@@ -72,31 +116,32 @@ class PureGraphEngine:
         """
         if n == 2 or n == 3: return True
         if n < 2 or (n & 1) == 0: return False
-        if math.isqrt(n)**2 == n: return False
+        if ((QR64 >> (n & 63)) & 1 and (QR63 >> (n % 63)) & 1
+                and (QR65 >> (n % 65)) & 1 and math.isqrt(n)**2 == n):
+            return False
 
         # 1. Calibración de Energía (Buscando Inercia)
         # Necesitamos un x tal que x^2-4 sea no-residuo.
+        # Jacobi == 0 <=> gcd(disc, n) > 1: el gcd solo se paga en ese caso.
         x = 0
         found = False
-        for k in range(100):
-            cand = k + 3
+        jacobi = PureGraphEngine._jacobi
+        for k, disc in enumerate(DISCS):
             # Discriminante del Grafo T(x) con Q=1
-            disc = cand*cand - 4
-            
-            g = math.gcd(disc, n)
-            if g > 1 and g < n: return False # Fractura algebraica
-            
-            if PureGraphEngine._jacobi(disc, n) == -1:
-                x = cand
+            j = jacobi(disc, n)
+            if j == -1:
+                x = k + 3
                 found = True
                 break
+            if j == 0 and math.gcd(disc, n) < n:
+                return False # Fractura algebraica
         
         if not found: return False 
 
         # 2. Construcción del Operador
         # T = [[x, -1], [1, 0]]
         # Nota: -1 mod n es n-1
-        T = [x, n - 1, 1, 0]
+        T = (x, n - 1, 1, 0)
 
         # 3. Descomposición del Ciclo
         # Ciclo ideal: N+1
@@ -112,8 +157,8 @@ class PureGraphEngine:
         G = PureGraphEngine._mat_pow(T, d, n)
 
         # Definimos las matrices topológicas clave
-        Identity = [1, 0, 0, 1]
-        Antipode = [n - 1, 0, 0, n - 1] # -I = [[-1, 0], [0, -1]]
+        Identity = (1, 0, 0, 1)
+        Antipode = (n - 1, 0, 0, n - 1) # -I = [[-1, 0], [0, -1]]
 
         # CHECK 1: Resonancia Base
         # Si G == I, el ciclo se cerró en d.
@@ -125,13 +170,20 @@ class PureGraphEngine:
 
         # CHECK 2: Ascenso Diádico
         # Buscamos la transición -I -> I
+        # Cuadrados desplegados sobre locales; I y -I son diagonales, así
+        # que basta comparar la diagonal cuando la antidiagonal es nula.
+        g0, g1, g2, g3 = G
+        m = n - 1
         for _ in range(s - 1):
-            G = PureGraphEngine._mat_sq(G, n)
-            
-            if G == Antipode:
-                return True
-            if G == Identity:
-                return False # Fractura: Llegamos a I sin pasar por -I
+            bc = g1 * g2
+            ad = g0 + g3
+            g0, g1, g2, g3 = (g0*g0 + bc) % n, (g1*ad) % n, (g2*ad) % n, (g3*g3 + bc) % n
+
+            if g1 == 0 and g2 == 0 and g0 == g3:
+                if g0 == m:
+                    return True
+                if g0 == 1:
+                    return False # Fractura: Llegamos a I sin pasar por -I
 
         return False
 
@@ -139,45 +191,126 @@ class PureGraphEngine:
 # AUDITORÍA (10^7)
 # ==============================================================================
 
+# Verdad de referencia: criba construida una vez en el proceso padre y
+# entregada por el inicializador del Pool (una vez por proceso, no por tarea;
+# con fork se comparte copy-on-write).
+_SIEVE = None
+
+def build_sieve(limit):
+    """Criba de Eratóstenes sobre [0, limit]: sieve[k] == 1 si k es primo."""
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0:2] = b'\x00\x00'
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p*p::p] = bytes(len(range(p*p, limit + 1, p)))
+    return sieve
+
+# Cola de informes hacia el padre (None fuera del Pool: se escribe directo).
+# El progreso lo cuenta el padre por fragmento; los workers solo envían fracturas.
+_REPORT_Q = None
+
+def _init_worker(sieve, report_q=None):
+    """
+    Inicializador del Pool: cada proceso recibe la criba y la cola de
+    informes una sola vez (también con 'spawn', donde los globales del padre
+    no se heredan).
+    """
+    global _SIEVE, _REPORT_Q
+    _SIEVE = sieve
+    _REPORT_Q = report_q
+
+def _report(line):
+    """Fractura: al hilo reportero del padre si hay cola; si no, a stdout."""
+    if _REPORT_Q is None:
+        print(line, flush=True)
+    else:
+        _REPORT_Q.put(line)
+
+def _reporter(report_q):
+    """Hilo del padre: único escritor de stdout mientras corre el Pool."""
+    for line in iter(report_q.get, None):
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
 def audit_worker(args):
     _, start, end = args
     if (start & 1) == 0: start += 1
     
+    # Enlace local: evita la búsqueda de atributo por candidato
+    analyze = PureGraphEngine.analyze_graph
+    sieve = _SIEVE
+
     fails = []
-    curr = start
-    while curr < end:
-        res_graph = PureGraphEngine.analyze_graph(curr)
-        res_true = isprime(curr) # Ground truth
+    # Todo impar pasa por el motor: la auditoría mide a analyze_graph, así
+    # que ningún candidato se descarta antes (un prefiltro ocultaría sus
+    # falsos positivos con factores pequeños).
+    # El progreso lo informa el padre por fragmento; aquí solo se envían
+    # (en cuanto aparecen) las fracturas.
+    for curr in range(start, end, 2):
+        res_graph = analyze(curr)
+        res_true = sieve[curr] == 1 # Ground truth
         
         if res_graph != res_true:
             err = "FALSO POSITIVO" if res_graph else "FALSO NEGATIVO"
             fails.append((curr, err))
-            print(f"🚨 FRACTURA: N={curr} | {err}", flush=True)
-            
-        curr += 2
+            _report(f"🚨 FRACTURA: N={curr} | {err}")
     return fails
 
+def gen_tasks(target, batches):
+    """
+    Fragmentos (id, inicio, fin) de [2, target) generados bajo demanda: el
+    pool los consume a medida que despacha, sin lista previa en el padre.
+    El último fragmento absorbe el resto de la división.
+    """
+    step = target // batches
+    for i in range(batches):
+        end = target if i == batches - 1 else 2 + (i + 1) * step
+        yield (i + 1, 2 + i * step, end)
+
 def run_pure_audit():
     TARGET = 10_000_000
     CORES = cpu_count()
-    BATCHES = CORES * 8
+    # Fragmentos finos: el coste por candidato crece con N, así que un solo
+    # rango por núcleo deja a los primeros workers ociosos al final.
+    BATCHES = CORES * 16
+    # Bloques de fragmentos por envío: amortiza el IPC del pool sin perder
+    # el reparto dinámico (un chunksize menor da progreso más fino).
+    CHUNKSIZE = max(1, BATCHES // (CORES * 4))
     
     print(f"[*] INICIANDO AUDITORÍA TOPODINÁMICA PURA (MATRICIAL)")
     print(f"[*] Objeto: Matriz T(x) Completa (Q=1).")
     print(f"[*] Criterio: Existencia de matriz Antípodas (-I) en la órbita.")
+    print(f"[*] Reparto: {BATCHES} fragmentos, chunksize={CHUNKSIZE}.")
     print("-" * 65)
     
-    step = TARGET // BATCHES
-    tasks = [(i+1, 2 + i*step, 2 + (i+1)*step) for i in range(BATCHES)]
-    if tasks: tasks[-1] = (BATCHES, tasks[-1][1], TARGET)
-    
     t0 = time.time()
+    sieve = build_sieve(TARGET)
+    print(f"[*] Criba de referencia lista ({time.time()-t0:.2f}s).")
+
+    # Progreso agregado (uno cada REPORT_EVERY fragmentos) y fracturas pasan
+    # por la misma cola: un único hilo escribe en stdout, sin que la salida
+    # de varios procesos se entremezcle.
+    REPORT_EVERY = max(1, BATCHES // 20)
+    report_q = Queue()
+    reporter = threading.Thread(target=_reporter, args=(report_q,), daemon=True)
+    reporter.start()
+
     errs = 0
-    with Pool(CORES) as pool:
-        for i, res in enumerate(pool.imap_unordered(audit_worker, tasks)):
+    done = 0
+    with Pool(CORES, initializer=_init_worker, initargs=(sieve, report_q)) as pool:
+        tasks = gen_tasks(TARGET, BATCHES)
+        for res in pool.imap_unordered(audit_worker, tasks, chunksize=CHUNKSIZE):
             errs += len(res)
-            if i % 10 == 0: print(f"   -> Progreso: Lotes {i} OK", flush=True)
-            
+            done += 1
+            if done % REPORT_EVERY == 0 or done == BATCHES:
+                report_q.put(f"   -> {done}/{BATCHES} fragmentos auditados ({errs} fracturas)")
+        # Cierre ordenado (no terminate): cada worker vacía su cola al salir
+        pool.close()
+        pool.join()
+
+    report_q.put(None)
+    reporter.join()
+
     print("-" * 65)
     print(f"[*] Tiempo: {time.time()-t0:.2f}s")
     if errs == 0:
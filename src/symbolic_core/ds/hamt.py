@@ -3,18 +3,19 @@ src/symbolic_core/ds/hamt.py
 Estructura de Datos Persistente: Hash Array Mapped Trie (HAMT) v4.5.
 GARANTÍA: Lógica de navegación 100% desacoplada del runtime de Python.
 """
-from typing import Optional, TYPE_CHECKING, Dict, Any
+from typing import Optional, Dict, Any
 from ..kernel.universe import Universe
+from ..kernel.node import Node
 from ..opcodes import *
 # [CRÍTICO] Importamos la calculadora de hash real
 from ..hashing.utils import holographic_hash
 
-if TYPE_CHECKING:
-    from ..kernel.node import Node
-
 SHIFT_STEP = 5
 MASK = 0b11111 
 
+# Raíz del mapa vacío (bitmap 0, sin hijos)
+_EMPTY_UID = Universe.intern(OP_HAMT, (0,))
+
 class HAMT:
     __slots__ = ('uid',)
 
@@ -23,31 +24,60 @@ class HAMT:
 
     @staticmethod
     def empty() -> 'HAMT':
-        uid = Universe.intern(OP_HAMT, (0,))
-        return HAMT(uid)
+        # El UID del mapa vacío es constante (puro contenido): basta con
+        # comprobar que sigue vivo; solo se re-interna si el Universo lo perdió.
+        if not Universe.is_live(_EMPTY_UID):
+            Universe.intern(OP_HAMT, (0,))
+        return HAMT(_EMPTY_UID)
     
     @staticmethod
     def from_dict(data: Dict[Any, Any]) -> 'HAMT':
-        from ..kernel.node import Node
+        """
+        Construcción en lote: claves y valores se resuelven a UIDs crudos
+        (intern_val directo, sin Node intermedio) y Universe.from_map
+        particiona por buckets de 5 bits de abajo arriba.
+        """
+        intern_val = Universe.intern_val
         prepared_map = {}
         for k, v in data.items():
-            k_node = k if isinstance(k, Node) else Node.val(k)
-            v_node = v if isinstance(v, Node) else Node.val(v)
-            prepared_map[k_node.uid] = v_node.uid
-        root_uid = Universe.from_map(prepared_map)
-        return HAMT(root_uid)
+            k_uid = k.uid if isinstance(k, Node) else intern_val(k)
+            v_uid = v.uid if isinstance(v, Node) else intern_val(v)
+            prepared_map[k_uid] = v_uid
+        return TransientHAMT(prepared_map).persistent()
+
+    def transient(self) -> 'TransientHAMT':
+        """
+        Constructor mutable (transient/persistent!) para llenar mapas en bucle:
+        los put no copian caminos; la topología se construye una sola vez al
+        congelar, y es la misma que produce la inserción secuencial.
+        """
+        return TransientHAMT(self._entries())
+
+    def _entries(self) -> Dict[int, int]:
+        """Pares (key_uid -> value_uid) de todas las hojas, sin recursión."""
+        get_op, get_args = Universe.get_op, Universe.get_args
+        entries = {}
+        stack = [self.uid]
+        while stack:
+            node_uid = stack.pop()
+            args = get_args(node_uid)
+            if get_op(node_uid) == OP_HAMT:
+                stack.extend(args[1:])
+            else:
+                entries[args[0]] = args[1]
+        return entries
 
     def put(self, key: 'Node', value: 'Node') -> 'HAMT':
         # [SEGURIDAD] Usamos holographic_hash directo.
         # Ignoramos key.__hash__() para evitar la interferencia de Python.
         h = holographic_hash(key.uid)
-        new_root_uid = self._put_recursive(self.uid, key, value, h, 0)
+        new_root_uid = self._put_path(self.uid, key.uid, value.uid, h, 0)
         return HAMT(new_root_uid)
 
     def get(self, key: 'Node') -> Optional['Node']:
         # [SEGURIDAD] Idem.
         h = holographic_hash(key.uid)
-        return self._get_recursive(self.uid, key, h, 0)
+        return self._get_path(self.uid, key.uid, h, 0)
     
     def __getitem__(self, key: 'Node') -> 'Node':
         val = self.get(key)
@@ -55,87 +85,137 @@ class HAMT:
             raise KeyError(f"Clave no encontrada: {key}")
         return val
 
-    # --- Lógica Interna Recursiva ---
-
-    def _put_recursive(self, node_uid: int, key: 'Node', value: 'Node', h: int, shift: int) -> int:
-        op = Universe.get_op(node_uid)
-        args = Universe.get_args(node_uid)
-
-        if op == OP_HAMT:
-            bitmap = args[0]
-            children = args[1:]
-            
-            # Aritmética pura de 64 bits (h viene de holographic_hash)
-            bit_index = (h >> shift) & MASK
-            bit_mask = 1 << bit_index
-            
-            exists = (bitmap & bit_mask) != 0
-            child_idx = (bitmap & (bit_mask - 1)).bit_count()
-            
-            if exists:
-                child_uid = children[child_idx]
-                new_child_uid = self._put_recursive(child_uid, key, value, h, shift + SHIFT_STEP)
-                
-                new_children = list(children)
-                new_children[child_idx] = new_child_uid 
-                return Universe.intern(OP_HAMT, (bitmap, *new_children))
-            else:
-                new_leaf_uid = Universe.intern(OP_KV, (key.uid, value.uid))
-                
-                new_children = list(children)
-                new_children.insert(child_idx, new_leaf_uid)
-                new_bitmap = bitmap | bit_mask
-                
-                return Universe.intern(OP_HAMT, (new_bitmap, *new_children))
-
-        elif op == OP_KV:
-            existing_key_uid = args[0]
-            existing_val_uid = args[1]
-            
-            if existing_key_uid == key.uid:
-                return Universe.intern(OP_KV, (key.uid, value.uid))
-            
-            # Colisión
-            empty_hamt_uid = Universe.intern(OP_HAMT, (0,))
-            sub_hamt_uid = self._put_recursive_raw(empty_hamt_uid, existing_key_uid, existing_val_uid, shift)
-            return self._put_recursive(sub_hamt_uid, key, value, h, shift)
-
-        raise ValueError(f"CRITICAL: HAMT corrupto. OpCode {hex(op)}")
-
-    def _put_recursive_raw(self, node_uid: int, k_uid: int, v_uid: int, shift: int) -> int:
-        from ..kernel.node import Node
-        # [SEGURIDAD] Recalcular hash puro desde UID crudo
-        h = holographic_hash(k_uid)
-        
-        # Instanciamos Node wrappers solo para pasar el chequeo de tipos si fuera necesario
-        # o pasamos UIDs si refactorizamos _put_recursive para aceptar UIDs.
-        # Por ahora, mantenemos la firma con Node.
-        k_node = Node(k_uid)
-        v_node = Node(v_uid)
-        
-        return self._put_recursive(node_uid, k_node, v_node, h, shift)
-
-    def _get_recursive(self, node_uid: int, key: 'Node', h: int, shift: int) -> Optional['Node']:
-        op = Universe.get_op(node_uid)
-        args = Universe.get_args(node_uid)
-
-        if op == OP_HAMT:
-            bitmap = args[0]
-            bit_index = (h >> shift) & MASK
-            bit_mask = 1 << bit_index
-            
-            if (bitmap & bit_mask) == 0:
-                return None
-            
-            child_idx = (bitmap & (bit_mask - 1)).bit_count()
-            child_uid = args[1 + child_idx]
-            
-            return self._get_recursive(child_uid, key, h, shift + SHIFT_STEP)
-
-        elif op == OP_KV:
-            if args[0] == key.uid:
-                from ..kernel.node import Node
+    # --- Lógica Interna (Descenso Iterativo) ---
+
+    def _put_path(self, node_uid: int, key_uid: int, value_uid: int, h: int, shift: int) -> int:
+        """
+        Inserción sin recursión de Python (trabaja sobre UIDs crudos).
+        Fase 1: descenso anotando el camino (args, pos) de cada nivel.
+        Fase 2: path-copy de abajo arriba reinternando solo ese camino.
+        """
+        path = []
+        # Métodos del Universe ligados a locales: un LOAD_FAST por nivel.
+        get_op, get_args = Universe.get_op, Universe.get_args
+        while True:
+            op = get_op(node_uid)
+            args = get_args(node_uid)
+
+            if op == OP_HAMT:
+                bitmap = args[0]
+
+                # Aritmética pura de 64 bits (h viene de holographic_hash)
+                bit_mask = 1 << ((h >> shift) & MASK)
+                # Posición física del hijo dentro de args (args[0] es el bitmap)
+                pos = 1 + (bitmap & (bit_mask - 1)).bit_count()
+
+                if bitmap & bit_mask:
+                    path.append((args, pos))
+                    node_uid = args[pos]
+                    shift += SHIFT_STEP
+                    continue
+
+                new_leaf_uid = Universe.intern_kv(key_uid, value_uid)
+                new_uid = Universe.intern(OP_HAMT, (bitmap | bit_mask,) + args[1:pos] + (new_leaf_uid,) + args[pos:])
+                break
+
+            elif op == OP_KV:
+                if args[0] == key_uid:
+                    new_uid = Universe.intern_kv(key_uid, value_uid)
+                    break
+
+                # Colisión: el KV existente (node_uid) y la hoja nueva se
+                # separan en un sub-árbol construido directamente.
+                new_leaf_uid = Universe.intern_kv(key_uid, value_uid)
+                new_uid = self._split_leaves(node_uid, holographic_hash(args[0]), new_leaf_uid, h, shift)
+                break
+
+            raise ValueError(f"CRITICAL: HAMT corrupto. OpCode {hex(op)}")
+
+        # Path-copy por concatenación de tuplas: un solo slice por lado.
+        for args, pos in reversed(path):
+            new_uid = Universe.intern(OP_HAMT, (args[0],) + args[1:pos] + (new_uid,) + args[pos + 1:])
+        return new_uid
+
+    @staticmethod
+    def _split_leaves(leaf_a: int, h_a: int, leaf_b: int, h_b: int, shift: int) -> int:
+        """
+        Sub-HAMT para dos hojas que colisionan a partir de 'shift'.
+        Mientras compartan bucket se encadenan nodos de un solo hijo; en el
+        primer nivel donde difieren se crea el nodo con ambas hojas.
+        (Misma topología que produce Universe.from_map.)
+        """
+        shared = []
+        while True:
+            if shift >= 64:
+                raise ValueError("CRITICAL: Colisión completa de hash de 64 bits en HAMT.")
+            idx_a = (h_a >> shift) & MASK
+            idx_b = (h_b >> shift) & MASK
+            if idx_a != idx_b:
+                break
+            shared.append(1 << idx_a)
+            shift += SHIFT_STEP
+
+        bitmap = (1 << idx_a) | (1 << idx_b)
+        children = (leaf_a, leaf_b) if idx_a < idx_b else (leaf_b, leaf_a)
+        uid = Universe.intern(OP_HAMT, (bitmap,) + children)
+
+        for bit in reversed(shared):
+            uid = Universe.intern(OP_HAMT, (bit, uid))
+        return uid
+
+    def _get_path(self, node_uid: int, key_uid: int, h: int, shift: int) -> Optional['Node']:
+        """Búsqueda sin recursión: un nivel del trie por vuelta."""
+        get_op, get_args = Universe.get_op, Universe.get_args
+        while True:
+            op = get_op(node_uid)
+            args = get_args(node_uid)
+
+            if op == OP_HAMT:
+                bitmap = args[0]
+                bit_mask = 1 << ((h >> shift) & MASK)
+
+                if (bitmap & bit_mask) == 0:
+                    return None
+
+                node_uid = args[1 + (bitmap & (bit_mask - 1)).bit_count()]
+                shift += SHIFT_STEP
+                continue
+
+            if op == OP_KV and args[0] == key_uid:
                 return Node(args[1])
             return None
 
-        return None
\ No newline at end of file
+
+class TransientHAMT:
+    """
+    Vista mutable de un HAMT en construcción (un solo dueño, un solo uso).
+    Tras persistent() queda inutilizable: el mapa congelado no debe verse
+    alterado por escrituras posteriores.
+    """
+    __slots__ = ('_entries',)
+
+    def __init__(self, entries: Dict[int, int]):
+        self._entries = entries
+
+    def _live(self) -> Dict[int, int]:
+        if self._entries is None:
+            raise ValueError("CRITICAL: TransientHAMT usado tras persistent().")
+        return self._entries
+
+    def put(self, key: 'Node', value: 'Node') -> 'TransientHAMT':
+        """Inserción in-place O(1); devuelve self para encadenar."""
+        self._live()[key.uid] = value.uid
+        return self
+
+    def get(self, key: 'Node') -> Optional['Node']:
+        value_uid = self._live().get(key.uid)
+        return None if value_uid is None else Node(value_uid)
+
+    def __len__(self) -> int:
+        return len(self._live())
+
+    def persistent(self) -> HAMT:
+        """Congela el builder: construcción bottom-up vía Universe.from_map."""
+        entries = self._live()
+        self._entries = None
+        return HAMT(Universe.from_map(entries))
@@ -3,7 +3,7 @@ src/symbolic_core/ds/list.py
 Estructura de Datos Persistente: Lista Enlazada (Cons List).
 Versión 2.0: Functional-Ready & Stack-Safe.
 """
-from typing import Optional, Iterator, Any, List as PyList, Callable, TypeVar, Generic
+from typing import Optional, Iterator, Any, Dict, List as PyList, Callable, TypeVar, Generic
 from ..kernel.universe import Universe
 from ..kernel.node import Node
 from ..opcodes import *
@@ -11,6 +11,18 @@ from ..opcodes import *
 # Definimos el ID de NIL de forma segura
 _NIL_ID = Universe.intern(OP_SYMBOL, (Universe.intern_blob(b"__NIL__"),))
 
+# Longitudes memoizadas por UID de celda. El UID es puro contenido: la
+# longitud de una celda no cambia nunca (ni tras delete + resurrección).
+# Acotada: al llenarse se vacía y __len__ vuelve a recorrer bajo demanda.
+LENGTH_CACHE_SIZE = 1 << 16
+_LENGTHS: Dict[int, int] = {_NIL_ID: 0}
+
+def _remember_length(uid: int, n: int):
+    if len(_LENGTHS) >= LENGTH_CACHE_SIZE:
+        _LENGTHS.clear()
+        _LENGTHS[_NIL_ID] = 0
+    _LENGTHS[uid] = n
+
 T = TypeVar('T')
 
 class ConsList:
@@ -35,16 +47,47 @@ class ConsList:
              raise TypeError(f"Tail must be ConsList, got {type(tail)}")
         
         uid = Universe.intern(OP_CONS, (head.uid, tail.uid))
+        # len = len(tail) + 1, si la cola ya es conocida
+        n = _LENGTHS.get(tail.uid)
+        if n is not None: _remember_length(uid, n + 1)
         return ConsList(uid)
 
     @staticmethod
     def from_python(items: PyList[Node]) -> 'ConsList':
         """O(N). Construye desde una lista Python."""
-        acc = ConsList.nil()
-        # Iteración inversa para construir O(N) sin recursión
+        # Iteración inversa a nivel de UID: cada celda depende del UID de la
+        # anterior (no admite intern_batch), pero se evita el ConsList
+        # intermedio; la cola es un UID de lista por construcción, así que
+        # solo se valida que cada elemento sea un Node.
+        intern = Universe.intern
+        acc = _NIL_ID
+        n = 0
         for item in reversed(items):
-            acc = ConsList.cons(item, acc)
-        return acc
+            if type(item) is not Node and not isinstance(item, Node):
+                raise TypeError(f"Item must be Node, got {type(item)}")
+            acc = intern(OP_CONS, (item.uid, acc))
+            n += 1
+            _remember_length(acc, n)
+        return ConsList(acc)
+
+    def reverse(self) -> 'ConsList':
+        """
+        O(N). Lista invertida en una sola pasada a nivel de UID.
+        Recorrer [a, b, c] haciendo cons sobre Nil produce [c, b, a]
+        directamente: sin lista Python intermedia ni Nodes.
+        """
+        get_args = Universe.get_args
+        intern = Universe.intern
+        nil = _NIL_ID
+        acc = nil
+        n = 0
+        uid = self.uid
+        while uid != nil:
+            head_uid, uid = get_args(uid)
+            acc = intern(OP_CONS, (head_uid, acc))
+            n += 1
+        _remember_length(acc, n)
+        return ConsList(acc)
 
     @property
     def is_empty(self) -> bool:
@@ -74,11 +117,15 @@ class ConsList:
         if self.is_empty: return self
         
         # 1. Recolectar resultados en lista Python temporal (rápido en RAM)
+        # Recorrido a nivel de UID: un solo get_args por celda y ningún
+        # ConsList intermedio; solo se crea el Node que recibe fn.
+        get_args = Universe.get_args
+        nil = _NIL_ID
         temp_items = []
-        curr = self
-        while not curr.is_empty:
-            temp_items.append(fn(curr.head))
-            curr = curr.tail
+        uid = self.uid
+        while uid != nil:
+            head_uid, uid = get_args(uid)
+            temp_items.append(fn(Node(head_uid)))
         
         # 2. Reconstruir ConsList
         return ConsList.from_python(temp_items)
@@ -87,42 +134,62 @@ class ConsList:
         """Retorna nueva lista solo con nodos que cumplan predicate(node)."""
         if self.is_empty: return self
         
+        get_args = Universe.get_args
+        nil = _NIL_ID
         temp_items = []
-        curr = self
-        while not curr.is_empty:
-            head = curr.head
+        uid = self.uid
+        while uid != nil:
+            head_uid, uid = get_args(uid)
+            head = Node(head_uid)
             if predicate(head):
                 temp_items.append(head)
-            curr = curr.tail
             
         return ConsList.from_python(temp_items)
 
     def fold(self, fn: Callable[[Any, Node], Any], initial: Any) -> Any:
         """Reduce la lista a un valor acumulado (Left Fold)."""
+        get_args = Universe.get_args
+        nil = _NIL_ID
         acc = initial
-        curr = self
-        while not curr.is_empty:
-            acc = fn(acc, curr.head)
-            curr = curr.tail
+        uid = self.uid
+        while uid != nil:
+            head_uid, uid = get_args(uid)
+            acc = fn(acc, Node(head_uid))
         return acc
 
     # --- PYTHON MAGIC METHODS ---
 
     def __iter__(self) -> Iterator[Node]:
         """Iterador seguro O(N)."""
-        curr = self
-        while not curr.is_empty:
-            yield curr.head
-            curr = curr.tail
+        get_args = Universe.get_args
+        nil = _NIL_ID
+        uid = self.uid
+        while uid != nil:
+            head_uid, uid = get_args(uid)
+            yield Node(head_uid)
 
     def __len__(self) -> int:
-        """O(N) Iterativo. Safe for 1M+ items."""
-        count = 0
-        curr = self
-        while not curr.is_empty:
-            count += 1
-            curr = curr.tail
-        return count
+        """
+        O(1) si la longitud ya está memoizada (listas creadas con cons).
+        Si no, recorrido iterativo hasta la primera celda conocida (o Nil)
+        y se memoiza el tramo recorrido. Safe for 1M+ items.
+        """
+        lengths = _LENGTHS
+        n = lengths.get(self.uid)
+        if n is not None: return n
+
+        get_args = Universe.get_args
+        path = []
+        uid = self.uid
+        while True:
+            n = lengths.get(uid)
+            if n is not None: break
+            path.append(uid)
+            uid = get_args(uid)[1]
+        for uid in reversed(path):
+            n += 1
+            _remember_length(uid, n)
+        return n
 
     def __repr__(self):
         """Impresión segura. Trunca si es muy larga."""
@@ -132,13 +199,14 @@ class ConsList:
         count = 0
         limit = 10 # Safety limit para logs
         
-        curr = self
-        while not curr.is_empty and count < limit:
-            items.append(repr(curr.head))
-            curr = curr.tail
+        get_args = Universe.get_args
+        uid = self.uid
+        while uid != _NIL_ID and count < limit:
+            head_uid, uid = get_args(uid)
+            items.append(repr(Node(head_uid)))
             count += 1
             
-        if not curr.is_empty:
+        if uid != _NIL_ID:
             items.append("...")
             
         return f"List[{', '.join(items)}]"
@@ -7,7 +7,7 @@ from typing import Optional, Tuple, Iterator
 from ..kernel.universe import Universe
 from ..kernel.node import Node
 from ..opcodes import *
-from .list import ConsList
+from .list import ConsList, _NIL_ID
 
 class ImmutableQueue:
     """
@@ -30,18 +30,14 @@ class ImmutableQueue:
 
     @staticmethod
     def _make(front: ConsList, rear: ConsList) -> 'ImmutableQueue':
-        if front.is_empty:
-            if not rear.is_empty:
-                # CORRECCIÓN:
-                # Rear (Stack): Top->[3, 2, 1]->Nil.  list(rear) -> [3, 2, 1]
-                # Queremos Front (Queue): Head->1->2->3->Nil.
-                # ConsList.from_python([A, B]) crea Head->A->B.
-                # Por tanto, necesitamos pasarle [1, 2, 3].
-                # Solución: reversed(list(rear))
-                
-                items = list(rear)
-                front = ConsList.from_python(list(reversed(items)))
-                rear = ConsList.nil()
+        if front.is_empty and not rear.is_empty:
+            # Volcado del Banker's Queue:
+            # Rear (Stack): Top->[3, 2, 1]->Nil.
+            # Queremos Front (Queue): Head->1->2->3->Nil, es decir, Rear invertida.
+            # ConsList.reverse lo hace en una pasada a nivel de UID y la nueva
+            # Rear es Nil directamente (sin pasar por ConsList.nil()).
+            uid = Universe.intern(OP_QUEUE, (rear.reverse().uid, _NIL_ID))
+            return ImmutableQueue(uid)
         
         uid = Universe.intern(OP_QUEUE, (front.uid, rear.uid))
         return ImmutableQueue(uid)
@@ -59,16 +55,17 @@ class ImmutableQueue:
         Si está vacía, retorna (None, Self).
         Amortizado O(1).
         """
-        front, rear = self._unpack()
+        get_args = Universe.get_args
+        front_uid, rear_uid = get_args(self.uid)
         
-        if front.is_empty:
+        if front_uid == _NIL_ID:
             return None, self
             
-        head = front.head
-        new_front = front.tail
+        # Cabeza y cola de Front con un solo get_args (head/tail leerían dos veces)
+        head_uid, new_front_uid = get_args(front_uid)
         
         # Usamos _make para rebalancear si new_front quedó vacía
-        return head, ImmutableQueue._make(new_front, rear)
+        return Node(head_uid), ImmutableQueue._make(ConsList(new_front_uid), ConsList(rear_uid))
 
     def peek(self) -> Optional[Node]:
         """Mira el primer elemento sin sacarlo."""
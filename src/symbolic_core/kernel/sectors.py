@@ -3,7 +3,7 @@ src/symbolic_core/kernel/sectors.py
 Definición de la Topología de Memoria v4.0.
 Configuración granular de Arenas por Tipo de Operación.
 """
-from typing import Dict
+from typing import List, Optional
 from ..opcodes import *
 from ..memory.allocator import MemoryPool
 
@@ -18,31 +18,57 @@ SECTOR_CONFIG = {
     OP_BLOB:   4096,   # Datos binarios
 }
 
+# Sectores cuyo payload se suelta al liberar el slot (no al reutilizarlo):
+# los bytes de un Blob o el valor de un Escalar borrado (str/bytes/int
+# grandes) no deben quedar residentes.
+CLEAR_ON_RELEASE = frozenset([OP_BLOB, OP_SCALAR])
+
+# Ranuras iniciales de la tabla de sectores (OpCode de 7 bits -> 128 tipos).
+# Se amplía bajo demanda si aparece un OpCode mayor.
+SECTOR_SLOTS = 128
+
 class SectorManager:
     """
     Orquestador de Memoria.
     Mapea OpCodes a Pools optimizados.
+    Los OpCodes son enteros pequeños y densos: la tabla es una lista indexada
+    por OpCode (acceso por índice, sin sondeo de dict en cada intern).
     """
-    _sectors: Dict[int, MemoryPool] = {}
+    _sectors: List[Optional[MemoryPool]] = [None] * SECTOR_SLOTS
 
     @classmethod
     def get_pool(cls, op_code: int) -> MemoryPool:
-        if op_code not in cls._sectors:
-            # Determinamos el tamaño de página óptimo
-            p_size = SECTOR_CONFIG.get(op_code, DEFAULT_PAGE_SIZE)
-            pool_name = f"Sector-{hex(op_code)}"
-            
-            # Inicialización Lazy
-            cls._sectors[op_code] = MemoryPool(name=pool_name, page_size=p_size)
-            
-        return cls._sectors[op_code]
+        sectors = cls._sectors
+        if 0 <= op_code < len(sectors):
+            pool = sectors[op_code]
+            if pool is not None:
+                return pool
+        return cls._create_pool(op_code)
+
+    @classmethod
+    def _create_pool(cls, op_code: int) -> MemoryPool:
+        """Inicialización Lazy del sector (camino frío)."""
+        if op_code < 0:
+            raise ValueError(f"CRITICAL: OpCode inválido para sector: {op_code}")
+        sectors = cls._sectors
+        if op_code >= len(sectors):
+            sectors.extend([None] * (op_code + 1 - len(sectors)))
+
+        # Determinamos el tamaño de página óptimo
+        p_size = SECTOR_CONFIG.get(op_code, DEFAULT_PAGE_SIZE)
+        pool_name = f"Sector-{hex(op_code)}"
+        pool = sectors[op_code] = MemoryPool(
+            name=pool_name, page_size=p_size,
+            clear_on_release=op_code in CLEAR_ON_RELEASE)
+        return pool
 
     @classmethod
     def stats(cls):
         """Informe completo del estado de la memoria."""
         return {
             op: pool.stats() 
-            for op, pool in cls._sectors.items()
+            for op, pool in enumerate(cls._sectors)
+            if pool is not None
         }
 
     @classmethod
@@ -51,7 +77,7 @@ class SectorManager:
         UTILIDAD DE TEST: Borra toda la memoria física.
         ¡PELIGRO! Solo usar en setUp/tearDown de tests.
         """
-        cls._sectors.clear()
+        cls._sectors[:] = [None] * SECTOR_SLOTS
 
 # Pre-calentamiento estratégico (opcional, evita lag en la primera operación)
 # SectorManager.get_pool(OP_SCALAR)
\ No newline at end of file
@@ -3,6 +3,7 @@ src/symbolic_core/kernel/strategies.py
 Motor de Estrategias v3.5 (Critical Fix).
 Corrección de Flujo: Evita el descarte silencioso del Agrupamiento Algebraico.
 """
+from collections import Counter
 from typing import Tuple, List, Protocol, Union, Optional, Dict
 from ..opcodes import *
 
@@ -12,6 +13,14 @@ class UniverseAccessor(Protocol):
     def intern_val(self, value: Union[int, float]) -> int: ... 
     def intern(self, op_code: int, args: Tuple[int, ...]) -> int: ...
 
+# OpCodes que normalize() puede reescribir (aplanamiento, plegado, reglas de
+# cálculo). El resto atraviesa normalize() intacto y no merece caché.
+REWRITE_OPS = frozenset(
+    [op for op, traits in enumerate(TRAITS_TABLE)
+     if traits & (TRAIT_ASSOCIATIVE | TRAIT_IDEMPOTENT)]
+    + [OP_DUAL, OP_POW, OP_EXP]
+)
+
 class NormalizationStrategy:
 
     @staticmethod
@@ -22,14 +31,14 @@ class NormalizationStrategy:
     ) -> Tuple[int, Tuple[int, ...]]:
         
         # 1. INTROSPECCIÓN FÍSICA
-        traits = get_traits(op_code)
+        traits = get_traits_mask(op_code)
         
         # 2. APLANAMIENTO
-        if traits & OpTraits.ASSOCIATIVE:
+        if traits & TRAIT_ASSOCIATIVE:
             args = NormalizationStrategy._flatten(op_code, args, accessor)
 
         # 3. ÁLGEBRA ARITMÉTICA (ADD, MUL)
-        if (traits & OpTraits.COMMUTATIVE) and op_code in (OP_ADD, OP_MUL):
+        if (traits & TRAIT_COMMUTATIVE) and op_code in (OP_ADD, OP_MUL):
             # A. Constant Folding
             res_op, res_args = NormalizationStrategy._fold_scalars(op_code, args, accessor)
             if res_op is not None: 
@@ -63,11 +72,11 @@ class NormalizationStrategy:
                 return NormalizationStrategy._distribute_dual_over_tensor(child_id, accessor)
 
         # 5. IDEMPOTENCIA
-        if traits & OpTraits.IDEMPOTENT:
+        if traits & TRAIT_IDEMPOTENT:
             args = tuple(sorted(set(args)))
 
         # 6. DEGENERACIÓN UNITARIA
-        if (traits & OpTraits.ASSOCIATIVE) and len(args) == 1:
+        if (traits & TRAIT_ASSOCIATIVE) and len(args) == 1:
             child_id = args[0]
             return accessor.get_op(child_id), accessor.get_args(child_id)
 
@@ -91,45 +100,47 @@ class NormalizationStrategy:
 
     @staticmethod
     def _flatten(op_code: int, args: Tuple[int, ...], accessor: UniverseAccessor) -> Tuple[int, ...]:
-        dirty = False
-        for arg in args:
-            if accessor.get_op(arg) == op_code:
-                dirty = True
-                break
-        if not dirty: return args
+        # Una sola pasada de OpCodes (map en C); la detección de 'dirty' es
+        # un 'in' sobre esa lista y la expansión la reutiliza.
+        ops = list(map(accessor.get_op, args))
+        if op_code not in ops: return args
 
+        get_args = accessor.get_args
         new_args = []
-        for arg_uid in args:
-            if accessor.get_op(arg_uid) == op_code:
-                new_args.extend(accessor.get_args(arg_uid))
+        for arg_uid, op in zip(args, ops):
+            if op == op_code:
+                new_args.extend(get_args(arg_uid))
             else:
                 new_args.append(arg_uid)
         return tuple(new_args)
 
     @staticmethod
     def _fold_scalars(op_code: int, args: Tuple[int, ...], accessor: UniverseAccessor) -> Tuple[Optional[int], Tuple[int, ...]]:
-        scalars = []
         symbolic = []
-        neutral = 0 if op_code == OP_ADD else 1
+        is_add = op_code == OP_ADD
+        neutral = 0 if is_add else 1
         absorber = 0 if op_code == OP_MUL else None
 
+        # Pasada única: clasificación, detección del absorbente y acumulación
+        # (en el mismo orden que antes, así que los floats no cambian).
+        get_op = accessor.get_op
+        get_args = accessor.get_args
+        accum = neutral
+        has_scalars = False
         for uid in args:
-            op = accessor.get_op(uid)
+            op = get_op(uid)
             if op == OP_SCALAR:
-                val = accessor.get_args(uid)[0]
+                val = get_args(uid)[0]
                 if val == absorber: 
                     zero = accessor.intern_val(0)
                     return accessor.get_op(zero), accessor.get_args(zero)
-                scalars.append(val)
+                if is_add: accum += val
+                else: accum *= val
+                has_scalars = True
             else:
                 symbolic.append(uid)
         
-        if not scalars: return None, args
-
-        accum = neutral
-        for s in scalars:
-            if op_code == OP_ADD: accum += s
-            elif op_code == OP_MUL: accum *= s
+        if not has_scalars: return None, args
         
         if accum == neutral:
             if not symbolic:
@@ -149,10 +160,8 @@ class NormalizationStrategy:
         Esto ahorra O(N) de memoria y tiempo en listas auxiliares.
         """
         # 1. Construcción Rápida del Histograma
-        # Usamos dict.get para velocidad en CPython
-        counts: Dict[int, int] = {}
-        for uid in args:
-            counts[uid] = counts.get(uid, 0) + 1
+        # Counter cuenta en C (_count_elements): sin bucle Python por término
+        counts: Dict[int, int] = Counter(args)
             
         # 2. Short-Circuit: Si no hay duplicados, salir inmediatamente.
         # len(counts) == len(args) implica que todos son únicos.
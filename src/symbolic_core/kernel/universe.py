@@ -9,20 +9,45 @@ NOVEDADES v4.8:
 - GC Explícito para SYMBOL y KV (Fix Zombie Nodes).
 """
 import threading
-from typing import Tuple, Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Tuple, Dict, Any, List, Optional, Iterable
 
 from ..opcodes import *
 from .sectors import SectorManager
-from .strategies import NormalizationStrategy
+from .strategies import NormalizationStrategy, REWRITE_OPS
 from ..memory.allocator import MemoryPool
 
 # --- IMPORTACIONES HOLÓNICAS ---
 # [CRÍTICO] Usamos la utilidad central para garantizar aritmética idéntica a Node/HAMT
-from ..hashing.utils import holographic_hash
-from ..hashing.encoder import compute_signature, compute_scalar_signature
+from ..hashing.utils import holographic_hash_many
+from ..hashing.encoder import compute_signature, compute_signature_batch, compute_signature_from_uids, compute_scalar_signature
 from ..hashing.canonization import Canonizer
 from ..hashing.invariants import SHIFT_DEPTH, SHIFT_MASS, MASK_64, SHIFT_OP, MASK_OP
 
+# Firma memoizada para intern(): el UID es función pura de
+# (op, hijos, payload), así que los sub-patrones repetidos (re-internar el
+# mismo nodo, sub-árboles HAMT compartidos) no vuelven a pasar por BLAKE2b.
+SIGNATURE_CACHE_SIZE = 4096
+_signature_cached = lru_cache(maxsize=SIGNATURE_CACHE_SIZE)(compute_signature_from_uids)
+
+# --- GESTIÓN DE REFERENCIAS (GC) v4.8 ---
+# Qué argumentos son punteros que mantienen vida, por OpCode. Tabla única
+# para intern, intern_batch y la cascada de delete.
+#   HAMT:   args[0] es Bitmap (Data); args[1:] son Nodos.
+#   KV:     Key y Value.
+#   SYMBOL: args[0] es el UID del Blob (Nombre).
+#   SCALAR/BLOB/CHUNK: payload crudo, sin hijos (None).
+#   Resto (ADD, MUL, ...): todos los argumentos son hijos.
+_ALL_REFS = slice(None)
+_REF_SLICE: Dict[int, Optional[slice]] = {
+    OP_HAMT: slice(1, None),
+    OP_KV: slice(0, 2),
+    OP_SYMBOL: slice(0, 1),
+    OP_SCALAR: None,
+    OP_BLOB: None,
+    OP_CHUNK: None,
+}
+
 class Universe:
     # Candado Reentrante para operaciones recursivas
     _lock = threading.RLock()    
@@ -30,9 +55,18 @@ class Universe:
     # Hash Consing: UID -> Índice Físico
     _lookup: Dict[int, int] = {}
     
-    # Cache de Blobs: Contenido -> Índice Físico
+    # Cache de Blobs: Contenido -> UID (se purga en delete())
     _blob_lookup: Dict[bytes, int] = {}
 
+    # Símbolos: UID del Blob del nombre -> UID del Símbolo
+    _symbol_lookup: Dict[int, int] = {}
+
+    # Cache de Normalización: (OpCode, Args) -> (OpCode', Args')
+    # normalize() es función pura de sus entradas salvo por los nodos que
+    # interna por el camino; cada acierto se revalida contra _lookup.
+    _norm_cache: Dict[Tuple[int, Tuple[int, ...]], Tuple[int, Tuple[int, ...]]] = {}
+    NORM_CACHE_SIZE = 1 << 16
+
     # =========================================================================
     # SINGLE ITEM INTERN (Unitario)
     # =========================================================================
@@ -47,132 +81,130 @@ class Universe:
             return cls.intern_val(args[0])
 
         # 2. Normalización y Canonización
-        new_op, new_args = NormalizationStrategy.normalize(op_code, args, cls)
+        # Fuera de REWRITE_OPS (HAMT, KV, SYMBOL...) normalize() es la
+        # identidad: se omite la llamada y su introspección de traits.
+        if op_code not in REWRITE_OPS:
+            new_op, new_args = op_code, args
+        elif type(args) is tuple:
+            key = (op_code, args)
+            hit = cls._norm_cache.get(key)
+            if hit is not None and cls._is_live_result(hit):
+                new_op, new_args = hit
+            else:
+                new_op, new_args = NormalizationStrategy.normalize(op_code, args, cls)
+                if len(cls._norm_cache) >= cls.NORM_CACHE_SIZE:
+                    cls._norm_cache.clear()
+                cls._norm_cache[key] = (new_op, new_args)
+        else:
+            new_op, new_args = NormalizationStrategy.normalize(op_code, args, cls)
         if new_op == OP_SCALAR: return cls.intern_val(new_args[0])
-        args_canonical = Canonizer.sort_args(new_op, new_args)
+        # Solo los operadores conmutativos se reordenan; el resto (HAMT, CONS,
+        # SYMBOL...) pasa intacto sin llamar al Canonizer; solo se fija como
+        # tupla (la caché de firmas exige claves hashables: intern con listas).
+        if new_op in COMMUTATIVE_OPS:
+            args_canonical = Canonizer.sort_args(new_op, new_args)
+        elif type(new_args) is tuple:
+            args_canonical = new_args
+        else:
+            args_canonical = tuple(new_args)
 
         # 3. Cálculo de Firma
-        args_meta = []
         if new_op == OP_HAMT:
             if not args_canonical: raise ValueError("OP_HAMT sin argumentos.")
-            bitmap = args_canonical[0] 
-            children_uids = args_canonical[1:] 
-            for uid in children_uids:
-                args_meta.append(cls._extract_meta_fast(uid))
-            sig = compute_signature(new_op, children_uids, args_meta, extra_payload=bitmap)
+            # args[0] es el bitmap (payload); args[1:] son los hijos.
+            full_id = _signature_cached(new_op, args_canonical[1:], args_canonical[0])
         else:
-            for uid in args_canonical:
-                args_meta.append(cls._extract_meta_fast(uid))
-            sig = compute_signature(new_op, args_canonical, args_meta)
-
-        full_id = sig.full_id
+            full_id = _signature_cached(new_op, args_canonical)
 
         # 4. Hash Consing Optimista
-        if full_id in cls._lookup: return full_id
+        lookup = cls._lookup
+        if full_id in lookup: return full_id
 
         # 5. Materialización (Zona Crítica)
         with cls._lock:
-            if full_id in cls._lookup: return full_id
+            if full_id in lookup: return full_id
             pool = SectorManager.get_pool(new_op)
             
-            # --- GESTIÓN DE REFERENCIAS (GC) v4.8 ---
-            # Definimos explícitamente qué argumentos son punteros que mantienen vida.
-            
-            if new_op == OP_HAMT:
-                # args[0] es Bitmap (Data). args[1:] son Nodos (Punteros).
-                for i in range(1, len(args_canonical)):
-                    cls._retain_node(args_canonical[i])
-            
-            elif new_op == OP_KV:
-                # args[0] es Key, args[1] es Value. Ambos se retienen.
-                cls._retain_node(args_canonical[0])
-                cls._retain_node(args_canonical[1])
-                
-            elif new_op == OP_SYMBOL:
-                # args[0] es el UID del Blob (Nombre). Se retiene.
-                cls._retain_node(args_canonical[0])
-                
-            elif new_op not in (OP_SCALAR, OP_BLOB, OP_CHUNK):
-                # Caso estándar (ADD, MUL, etc.): Todos son hijos.
-                for arg_uid in args_canonical:
-                    cls._retain_node(arg_uid)
-            # ----------------------------------------
-
-            phys_idx = pool.alloc(args_canonical)
-            cls._lookup[full_id] = phys_idx
+            ref_slice = _REF_SLICE.get(new_op, _ALL_REFS)
+            if ref_slice is not None:
+                cls._retain_many(args_canonical[ref_slice])
+
+            lookup[full_id] = pool.alloc(args_canonical)
             
             return full_id
 
+    @classmethod
+    def _is_live_result(cls, result: Tuple[int, Tuple[int, ...]]) -> bool:
+        """Un resultado cacheado es válido si todos sus hijos siguen vivos."""
+        op, args = result
+        if op == OP_SCALAR: return True # Se re-interna por valor
+        lookup = cls._lookup
+        for uid in args:
+            if uid not in lookup: return False
+        return True
+
     # =========================================================================
     # BATCH PROCESSING (Vectorial)
     # =========================================================================
     @classmethod
     def intern_batch(cls, op_code: int, list_of_args: List[Tuple[int, ...]]) -> List[int]:
         """Procesamiento Vectorial Masivo."""
-        results = [0] * len(list_of_args)
-        to_alloc_indices = []
-        to_alloc_ids = []
-        to_alloc_data = []
-
-        # Fase 1: Cálculo CPU
-        for i, args in enumerate(list_of_args):
-            if op_code == OP_HAMT:
-                if not args: continue
-                bitmap = args[0]
-                children_uids = args[1:]
-                args_meta = [cls._extract_meta_fast(uid) for uid in children_uids]
-                sig = compute_signature(op_code, children_uids, args_meta, extra_payload=bitmap)
-            else:
-                args_meta = [cls._extract_meta_fast(uid) for uid in args]
-                sig = compute_signature(op_code, args, args_meta)
-            
-            full_id = sig.full_id
-            if full_id in cls._lookup:
-                results[i] = full_id
-            else:
-                to_alloc_indices.append(i)
-                to_alloc_ids.append(full_id)
-                to_alloc_data.append(args)
-
-        if not to_alloc_ids: return results
+        # Fase 1: Cálculo CPU (firmas del lote en una sola llamada)
+        full_ids = compute_signature_batch(op_code, list_of_args)
+        lookup = cls._lookup
+
+        # El UID de un acierto y el de un nodo recién materializado son el
+        # mismo full_id: el resultado es la propia lista de firmas y el
+        # camino de acierto no copia nada. Solo se recogen los fallos.
+        misses = [i for i, full_id in enumerate(full_ids)
+                  if full_id is not None and full_id not in lookup]
+        results = full_ids if None not in full_ids else [u or 0 for u in full_ids]
+        if not misses: return results
 
         # Fase 2: Alloc Masivo
         with cls._lock:
-            pool = SectorManager.get_pool(op_code)
-            final_alloc_data = []
-            final_alloc_map_indices = []
-            
-            for k, full_id in enumerate(to_alloc_ids):
-                if full_id in cls._lookup:
-                    results[to_alloc_indices[k]] = full_id
-                else:
-                    final_alloc_data.append(to_alloc_data[k])
-                    final_alloc_map_indices.append(k)
-
-            if final_alloc_data:
+            # Re-chequeo bajo candado; un UID repetido en el lote se
+            # materializa una sola vez.
+            pending: Dict[int, Tuple[int, ...]] = {}
+            for i in misses:
+                full_id = full_ids[i]
+                if full_id not in lookup and full_id not in pending:
+                    pending[full_id] = list_of_args[i]
+
+            if pending:
+                pool = SectorManager.get_pool(op_code)
+                final_alloc_data = list(pending.values())
                 phys_indices = pool.alloc_batch(final_alloc_data)
                 
                 # GC Batch
-                if op_code == OP_HAMT:
-                    for args_tuple in final_alloc_data:
-                        for i in range(1, len(args_tuple)): cls._retain_node(args_tuple[i])
-                elif op_code == OP_KV:
+                ref_slice = _REF_SLICE.get(op_code, _ALL_REFS)
+                if ref_slice is not None:
                     for args_tuple in final_alloc_data:
-                        cls._retain_node(args_tuple[0])
-                        cls._retain_node(args_tuple[1])
-                elif op_code not in (OP_SCALAR, OP_BLOB, OP_SYMBOL, OP_CHUNK):
-                    for args_tuple in final_alloc_data:
-                        for arg_uid in args_tuple: cls._retain_node(arg_uid)
+                        cls._retain_many(args_tuple[ref_slice])
 
-                for k, phys_idx in enumerate(phys_indices):
-                    map_idx = final_alloc_map_indices[k]
-                    original_idx = to_alloc_indices[map_idx]
-                    uid = to_alloc_ids[map_idx]
-                    cls._lookup[uid] = phys_idx
-                    results[original_idx] = uid
+                lookup.update(zip(pending, phys_indices))
 
         return results
 
+    @classmethod
+    def intern_kv(cls, key_uid: int, value_uid: int) -> int:
+        """
+        Camino especializado para hojas OP_KV (aridad 2 fija).
+        OP_KV no es conmutativo ni reescribible: normalize() y sort_args()
+        lo devuelven intacto, así que se omiten.
+        """
+        args = (key_uid, value_uid)
+        full_id = compute_signature_from_uids(OP_KV, args)
+        if full_id in cls._lookup: return full_id
+
+        with cls._lock:
+            if full_id in cls._lookup: return full_id
+            pool = SectorManager.get_pool(OP_KV)
+            # Clave y valor son punteros: ambos se retienen.
+            cls._retain_many(args)
+            cls._lookup[full_id] = pool.alloc(args)
+            return full_id
+
     # =========================================================================
     # MAPAS / HAMT (Construcción Canónica)
     # =========================================================================
@@ -180,7 +212,8 @@ class Universe:
     def from_map(cls, python_dict: Dict[int, int]) -> int:
         """
         Construye un HAMT topológicamente perfecto (Bottom-Up).
-        Usa 'holographic_hash' para garantizar consistencia Unsigned.
+        Usa 'holographic_hash_many' (mismo mezclador que HAMT.get, en lote)
+        para garantizar consistencia Unsigned.
         """
         if not python_dict:
             return cls.intern(OP_HAMT, (0,))
@@ -190,17 +223,15 @@ class Universe:
         pair_uids = cls.intern_batch(OP_KV, items)
         
         # 2. Asociar Hash Holográfico (Unsigned) con Hoja
-        leaf_nodes = []
-        for (k_uid, _), kv_node_uid in zip(items, pair_uids):
-            # [CRÍTICO] Usamos la utilidad centralizada.
-            # Esto evita discrepancias de signo con HAMT.get()
-            h_val = holographic_hash(k_uid)
-            leaf_nodes.append((h_val, kv_node_uid))
+        # [CRÍTICO] Usamos la utilidad centralizada (en lote).
+        # Esto evita discrepancias de signo con HAMT.get()
+        hashes = holographic_hash_many([k_uid for k_uid, _ in items])
+        leaf_nodes = list(zip(hashes, pair_uids))
             
         leaf_nodes.sort(key=lambda x: x[0])
         
         # 3. Construir Árbol
-        root_uid = cls._build_hamt_recursive(leaf_nodes, 0)
+        root_uid = cls._build_hamt(leaf_nodes, 0)
         
         # 4. Root Wrapper (Fix TypeError)
         # Si el resultado es una hoja KV suelta (mapa de 1 elemento),
@@ -214,29 +245,42 @@ class Universe:
         return root_uid
 
     @classmethod
-    def _build_hamt_recursive(cls, sorted_items: List[Tuple[int, int]], shift: int) -> int:
-        """Recursión de partición por buckets de 5 bits."""
-        # Caso Base: Hoja Única o Colisión Perfecta
+    def _build_hamt(cls, sorted_items: List[Tuple[int, int]], shift: int) -> int:
+        """
+        Partición por buckets de 5 bits.
+        La profundidad está acotada por el hash de 64 bits (13 niveles), y los
+        buckets de una sola hoja se resuelven en línea, sin llamada propia.
+        """
+        # Caso Base: Hoja Única
         if len(sorted_items) == 1:
             return sorted_items[0][1]
-
-        # Partición en 32 buckets
-        buckets = [[] for _ in range(32)]
-        mask = 0x1F
-        
-        for h_val, uid in sorted_items:
-            idx = (h_val >> shift) & mask
-            buckets[idx].append((h_val, uid))
+        if shift >= 64:
+            raise ValueError("CRITICAL: Colisión completa de hash de 64 bits en HAMT.")
+
+        # Partición por buckets de 5 bits: solo se crean los buckets ocupados
+        # (un dict, no 32 listas por nodo). Cada lista conserva el orden de
+        # entrada, así que los sub-buckets siguen ordenados por hash.
+        buckets: Dict[int, List[Tuple[int, int]]] = {}
+        for item in sorted_items:
+            idx = (item[0] >> shift) & 0x1F
+            bucket = buckets.get(idx)
+            if bucket is None:
+                buckets[idx] = [item]
+            else:
+                bucket.append(item)
             
-        # Construcción del Nodo
+        # Construcción del Nodo (hijos en orden de bit, como exige el bitmap)
         bitmap = 0
         children_uids = []
+        next_shift = shift + 5
         
-        for i, bucket in enumerate(buckets):
-            if bucket:
-                bitmap |= (1 << i)
-                child_uid = cls._build_hamt_recursive(bucket, shift + 5)
-                children_uids.append(child_uid)
+        for idx in sorted(buckets):
+            bitmap |= (1 << idx)
+            bucket = buckets[idx]
+            if len(bucket) == 1:
+                children_uids.append(bucket[0][1])
+            else:
+                children_uids.append(cls._build_hamt(bucket, next_shift))
                 
         return cls.intern(OP_HAMT, (bitmap,) + tuple(children_uids))
 
@@ -247,21 +291,20 @@ class Universe:
     def intern_val(cls, value: Any) -> int:
         sig = compute_scalar_signature(OP_SCALAR, value)
         uid = sig.full_id
-        if uid in cls._lookup: return uid
+        lookup = cls._lookup
+        if uid in lookup: return uid
         with cls._lock:
-            if uid in cls._lookup: return uid
+            if uid in lookup: return uid
             pool = SectorManager.get_pool(OP_SCALAR)
-            phys_idx = pool.alloc((value,))
-            cls._lookup[uid] = phys_idx
+            lookup[uid] = pool.alloc((value,))
             return uid
 
     @classmethod
     def intern_blob(cls, data: bytes) -> int:
-        if data in cls._blob_lookup:
-            phys_idx = cls._blob_lookup[data]
-            pool = SectorManager.get_pool(OP_BLOB)
-            stored_data = pool.get(phys_idx)
-            if stored_data: return stored_data[0] 
+        # Bytes -> UID: un acierto se valida con un sondeo de _lookup, sin
+        # leer el pool (y sin riesgo de leer un slot ya reciclado).
+        uid = cls._blob_lookup.get(data)
+        if uid is not None and uid in cls._lookup: return uid
 
         sig = compute_signature(OP_BLOB, (), [], extra_payload=data)
         uid = sig.full_id
@@ -270,46 +313,69 @@ class Universe:
         with cls._lock:
             if uid in cls._lookup: return uid
             pool = SectorManager.get_pool(OP_BLOB)
-            phys_idx = pool.alloc((uid, data))
-            cls._lookup[uid] = phys_idx
-            cls._blob_lookup[data] = phys_idx
+            cls._lookup[uid] = pool.alloc((uid, data))
+            cls._blob_lookup[data] = uid
             return uid
 
+    @classmethod
+    def intern_symbol(cls, name: bytes) -> int:
+        """
+        Símbolo + Blob del nombre en una sola operación.
+        OP_SYMBOL no tiene leyes algebraicas: se omiten normalización y
+        canonización, y un símbolo ya conocido se resuelve sin recalcular
+        su firma (UID del Blob -> UID del Símbolo, revalidado en _lookup).
+        """
+        blob_uid = cls.intern_blob(name)
+        uid = cls._symbol_lookup.get(blob_uid)
+        if uid is not None and uid in cls._lookup: return uid
+
+        uid = compute_signature_from_uids(OP_SYMBOL, (blob_uid,))
+        with cls._lock:
+            if uid not in cls._lookup:
+                pool = SectorManager.get_pool(OP_SYMBOL)
+                # args[0] es el UID del Blob (Nombre). Se retiene.
+                cls._retain_node(blob_uid)
+                cls._lookup[uid] = pool.alloc((blob_uid,))
+            cls._symbol_lookup[blob_uid] = uid
+        return uid
+
     # =========================================================================
     # LIFECYCLE
     # =========================================================================
     @classmethod
     def delete(cls, uid: int):
-        if uid not in cls._lookup: return
-        op_code, phys_idx = cls._decode_id(uid)
-        pool = SectorManager.get_pool(op_code)
-        raw_data = pool.get(phys_idx)
-        if raw_data is None: return 
+        """
+        Libera una referencia; si el nodo muere, la cascada GC baja a sus hijos
+        con una pila explícita (sin recursión ni límite de profundidad).
+        Los hijos se apilan en orden inverso: mismo recorrido que la versión
+        recursiva.
+        """
+        lookup = cls._lookup
+        stack = [uid]
+        while stack:
+            uid = stack.pop()
+            phys_idx = lookup.get(uid)
+            if phys_idx is None: continue
+            op_code = cls.get_op(uid)
+            pool = SectorManager.get_pool(op_code)
+            # Los hijos se leen ANTES de release(): tras liberar, el slot puede
+            # ser reutilizado por otro alloc.
+            raw_data = pool.get(phys_idx)
+            if raw_data is None: continue
 
-        is_dead = pool.release(phys_idx)
+            if not pool.release(phys_idx): continue
 
-        if is_dead:
             with cls._lock:
-                if uid in cls._lookup:
-                    del cls._lookup[uid]
-                    if op_code == OP_BLOB and raw_data[1] in cls._blob_lookup:
-                        del cls._blob_lookup[raw_data[1]]
-
-            # Recursión GC v4.8
-            if op_code == OP_HAMT:
-                # Saltar bitmap
-                for i in range(1, len(raw_data)):
-                    cls.delete(raw_data[i])
-            elif op_code == OP_KV:
-                # Borrar Key y Value
-                cls.delete(raw_data[0])
-                cls.delete(raw_data[1])
-            elif op_code == OP_SYMBOL:
-                # Borrar Blob del nombre
-                cls.delete(raw_data[0])
-            elif op_code not in (OP_SCALAR, OP_BLOB, OP_CHUNK):
-                for child_uid in raw_data:
-                    cls.delete(child_uid)
+                if lookup.pop(uid, None) is not None:
+                    if op_code == OP_BLOB:
+                        cls._blob_lookup.pop(raw_data[1], None)
+                    elif op_code == OP_SYMBOL:
+                        cls._symbol_lookup.pop(raw_data[0], None)
+
+            # Cascada GC v4.8
+            ref_slice = _REF_SLICE.get(op_code, _ALL_REFS)
+            if ref_slice is not None:
+                stack.extend(reversed(raw_data[ref_slice]))
 
     @classmethod
     def retain(cls, uid: int):
@@ -317,12 +383,29 @@ class Universe:
 
     @classmethod
     def _retain_node(cls, uid: int):
-        if uid not in cls._lookup: return 
-        op_code = cls.get_op(uid) 
-        phys_idx = cls._lookup[uid]
-        pool = SectorManager.get_pool(op_code)
+        phys_idx = cls._lookup.get(uid)
+        if phys_idx is None: return 
+        op_code = (uid >> SHIFT_OP) & MASK_OP
+        pool = SectorManager._sectors[op_code] if op_code < len(SectorManager._sectors) else None
+        if pool is None: pool = SectorManager.get_pool(op_code)
         pool.retain(phys_idx)
 
+    @classmethod
+    def _retain_many(cls, uids: Iterable[int]):
+        """
+        _retain_node en bucle con lookup y tabla de sectores en locales:
+        un índice de lista por hijo en vez de get_pool().
+        """
+        lookup = cls._lookup
+        sectors = SectorManager._sectors
+        for uid in uids:
+            phys_idx = lookup.get(uid)
+            if phys_idx is None: continue
+            op_code = (uid >> SHIFT_OP) & MASK_OP
+            pool = sectors[op_code] if op_code < len(sectors) else None
+            if pool is None: pool = SectorManager.get_pool(op_code)
+            pool.retain(phys_idx)
+
     # =========================================================================
     # INTROSPECCIÓN
     # =========================================================================
@@ -339,13 +422,22 @@ class Universe:
     @staticmethod
     def get_qec(uid: int) -> int: return (uid >> 192) & MASK_64
 
+    @classmethod
+    def is_live(cls, uid: int) -> bool:
+        """True si el UID tiene un nodo materializado (cachés externas lo revalidan aquí)."""
+        return uid in cls._lookup
+
     @classmethod
     def get_args(cls, uid: int) -> Tuple[int, ...]:
-        if uid not in cls._lookup:
+        # Un solo sondeo del dict (el hash de un int de 512 bits no se cachea)
+        phys_idx = cls._lookup.get(uid)
+        if phys_idx is None:
             raise ValueError(f"CRITICAL: Acceso a nodo muerto o inexistente UID={hex(uid)}")
-        phys_idx = cls._lookup[uid]
-        op_code = cls.get_op(uid)
-        pool = SectorManager.get_pool(op_code)
+        op_code = (uid >> SHIFT_OP) & MASK_OP
+        # Un nodo vivo tiene su sector creado: índice directo en la tabla.
+        sectors = SectorManager._sectors
+        pool = sectors[op_code] if op_code < len(sectors) else None
+        if pool is None: pool = SectorManager.get_pool(op_code)
         data = pool.get(phys_idx)
         if op_code == OP_BLOB: return data[1] 
         return data
@@ -356,7 +448,7 @@ class Universe:
     @classmethod
     def _decode_id(cls, uid: int) -> Tuple[int, int]:
         op_code = (uid >> SHIFT_OP) & MASK_OP
-        if uid not in cls._lookup:
+        phys_idx = cls._lookup.get(uid)
+        if phys_idx is None:
             raise ValueError(f"CRITICAL: Intento de decodificar UID muerto: {hex(uid)}")
-        phys_idx = cls._lookup[uid]
         return op_code, phys_idx
\ No newline at end of file
@@ -2,24 +2,40 @@
 src/symbolic_core/memory/allocator.py
 Arena Allocator v4.1 (Batch-Safe).
 Gestión de memoria física optimizada para inserciones masivas y Thread-Safety robusto.
+
+MODELO DE CONCURRENCIA (CPython + GIL):
+- array.pop()/append() y list[i] = x son atómicos bajo el GIL: la asignación
+  toma su índice de la free list sin candado (el índice queda en exclusiva).
+  Por eso la pila libre no usa un puntero 'top' aparte: decrementarlo y leer
+  serían dos pasos y exigirían el candado en cada alloc.
+- El RLock protege solo lo que no es atómico: la expansión de memoria y el
+  read-modify-write de los contadores (retain/release).
 """
 import threading
-from typing import List, Tuple, Deque, Optional, Dict, Iterable, Any
-from collections import deque
+from array import array
+from typing import List, Tuple, Optional, Dict, Iterable, Any
 
 class MemoryPool:
     """
     Gestor de memoria física LIFO (Hot Cache).
     Optimizado para High-Throughput.
+
+    RETENCIÓN: por defecto un slot liberado conserva su tupla (y todo lo que
+    referencia) hasta que alloc() lo reutiliza, y get() sobre él devuelve esos
+    datos obsoletos sin error. Con clear_on_release=True el slot se vacía al
+    morir (pools de payload pesado, p. ej. OP_BLOB): los bytes no quedan
+    residentes y get() devuelve None.
     """
     __slots__ = (
         '_data', '_ref_counts', '_free_list', '_lock', 
-        '_capacity', '_name', '_active_count', '_page_size'
+        '_capacity', '_name', '_page_size', '_clear_on_release'
     )
 
-    def __init__(self, name: str = "Unknown", page_size: int = 4096):
+    def __init__(self, name: str = "Unknown", page_size: int = 4096,
+                 clear_on_release: bool = False):
         self._name = name
         self._page_size = page_size
+        self._clear_on_release = clear_on_release
         
         # [MEJORA 1] RLock (Re-entrant Lock)
         # Permite que el mismo hilo adquiera el candado varias veces sin bloquearse.
@@ -28,26 +44,32 @@ class MemoryPool:
         
         # Estructuras Físicas
         self._data: List[Optional[Tuple[int, ...]]] = [None] * page_size
-        # Array de enteros nativos (mucho más rápido que objetos para el conteo)
-        self._ref_counts: List[int] = [0] * page_size
+        # Array de enteros nativos C (4 bytes por contador, sin PyLong por slot)
+        self._ref_counts = array('i', [0]) * page_size
         
-        # Cola de reciclaje (LIFO para caché caliente)
-        self._free_list: Deque[int] = deque(range(page_size))
+        # Pila de reciclaje (LIFO para caché caliente), índices como int32
+        # nativos: sin PyLong ni nodo de deque por slot libre.
+        self._free_list = array('i', range(page_size))
         
         self._capacity = page_size
-        self._active_count = 0
+
+    def _pop_free(self) -> int:
+        """Toma un slot libre; solo el camino de expansión pasa por el candado."""
+        free_list = self._free_list
+        while True:
+            try:
+                return free_list.pop()
+            except IndexError:
+                with self._lock:
+                    if not free_list:
+                        self._expand_memory(1)
 
     def alloc(self, args: Tuple[int, ...]) -> int:
-        """Asignación unitaria O(1)."""
-        with self._lock:
-            if not self._free_list:
-                self._expand_memory(1)
-            
-            idx = self._free_list.pop()
-            self._data[idx] = args
-            self._ref_counts[idx] = 1 # Ownership inicial
-            self._active_count += 1
-            return idx
+        """Asignación unitaria O(1), sin candado en el camino caliente."""
+        idx = self._pop_free()
+        self._data[idx] = args
+        self._ref_counts[idx] = 1 # Ownership inicial
+        return idx
 
     def alloc_batch(self, batch_args: List[Tuple[int, ...]]) -> List[int]:
         """
@@ -68,20 +90,20 @@ class MemoryPool:
                 needed = count - free_slots
                 # Expandimos (al menos lo necesario + margen de seguridad)
                 self._expand_memory(needed)
-            
-            # 2. Asignación Rápida
-            # Como ya hemos garantizado el espacio arriba, este bucle es seguro.
-            for args in batch_args:
-                try:
-                    idx = self._free_list.pop()
-                    self._data[idx] = args
-                    self._ref_counts[idx] = 1
-                    indices.append(idx)
-                except IndexError:
-                    # Defensive Coding: Esto protege contra corrupción de memoria teórica
-                    raise RuntimeError(f"CRITICAL: Allocator '{self._name}' corrupto. Falló expansión batch.")
-            
-            self._active_count += count
+        
+        # 2. Asignación Rápida (fuera del candado)
+        # Si otro hilo consumió slots entre medias, _pop_free vuelve a expandir.
+        pop = self._free_list.pop
+        data = self._data
+        ref_counts = self._ref_counts
+        for args in batch_args:
+            try:
+                idx = pop()
+            except IndexError:
+                idx = self._pop_free()
+            data[idx] = args
+            ref_counts[idx] = 1
+            indices.append(idx)
             
         return indices
 
@@ -102,9 +124,11 @@ class MemoryPool:
                 self._ref_counts[idx] -= 1
                 if self._ref_counts[idx] == 0:
                     is_dead = True
-                    self._data[idx] = None # Ayuda al GC de Python
+                    # El slot conserva su tupla hasta que alloc() lo reutilice
+                    # (sin escritura extra), salvo en pools que vacían al liberar.
+                    if self._clear_on_release:
+                        self._data[idx] = None
                     self._free_list.append(idx)
-                    self._active_count -= 1
         return is_dead
 
     def release_batch(self, indices: Iterable[int]) -> List[int]:
@@ -118,14 +142,19 @@ class MemoryPool:
                 if idx < self._capacity and self._ref_counts[idx] > 0:
                     self._ref_counts[idx] -= 1
                     if self._ref_counts[idx] == 0:
-                        self._data[idx] = None
+                        if self._clear_on_release:
+                            self._data[idx] = None
                         self._free_list.append(idx)
-                        self._active_count -= 1
                         dead_indices.append(idx)
         return dead_indices
 
     def get(self, idx: int) -> Optional[Tuple[int, ...]]:
-        """Lectura sin bloqueo (Optimistic Read)."""
+        """
+        Lectura sin bloqueo (Optimistic Read).
+        Un slot liberado devuelve datos obsoletos hasta su reutilización
+        (None si el pool vacía al liberar): el llamador valida la vida del
+        nodo antes (Universe.is_live).
+        """
         try:
             return self._data[idx]
         except IndexError:
@@ -149,22 +178,26 @@ class MemoryPool:
         
         # 3. Expansión Física
         self._data.extend([None] * growth)
-        self._ref_counts.extend([0] * growth)
+        self._ref_counts.extend(array('i', [0]) * growth)
         
         # 4. Actualización de Free List
-        # Añadimos el rango de nuevos índices disponibles al final de la cola
-        new_indices = range(self._capacity, self._capacity + growth)
-        self._free_list.extend(new_indices)
-        
+        # La capacidad se publica ANTES que los índices: un alloc sin candado
+        # puede tomar un slot nuevo en cuanto aparece en la free list.
+        old_capacity = self._capacity
         self._capacity += growth
+        self._free_list.extend(range(old_capacity, old_capacity + growth))
 
     def stats(self) -> Dict[str, Any]:
         """Introspección para monitoreo de salud."""
         with self._lock:
+            # Los activos se derivan de la free list: sin contador compartido
+            # que mantener en el camino caliente.
+            free = len(self._free_list)
+            active = self._capacity - free
             return {
                 "name": self._name,
                 "capacity": self._capacity,
-                "active": self._active_count,
-                "free": len(self._free_list),
-                "fragmentation": 1.0 - (self._active_count / (self._capacity or 1))
+                "active": active,
+                "free": free,
+                "fragmentation": 1.0 - (active / (self._capacity or 1))
             }
\ No newline at end of file
@@ -90,4 +90,28 @@ TRAITS_REGISTRY = {
 
 def get_traits(op_code: int) -> OpTraits:
     """Retorna las leyes físicas del operador."""
-    return TRAITS_REGISTRY.get(op_code, OpTraits.NONE)
\ No newline at end of file
+    return TRAITS_REGISTRY.get(op_code, OpTraits.NONE)
+
+# =============================================================================
+# VISTA DENSA (Camino Caliente)
+# =============================================================================
+# Las operaciones de IntFlag (&, |) pasan por Python y crean instancias nuevas.
+# Normalización y firma consultan las leyes en cada intern: usan una tabla de
+# ints planos indexada por OpCode y máscaras int equivalentes.
+TRAIT_COMMUTATIVE = int(OpTraits.COMMUTATIVE)
+TRAIT_ASSOCIATIVE = int(OpTraits.ASSOCIATIVE)
+TRAIT_IDEMPOTENT  = int(OpTraits.IDEMPOTENT)
+
+TRAITS_TABLE = tuple(int(TRAITS_REGISTRY.get(op, OpTraits.NONE))
+                     for op in range(max(TRAITS_REGISTRY) + 1))
+_TRAITS_SIZE = len(TRAITS_TABLE)
+
+def get_traits_mask(op_code: int) -> int:
+    """Como get_traits, pero devuelve un int plano (sin IntFlag)."""
+    return TRAITS_TABLE[op_code] if 0 <= op_code < _TRAITS_SIZE else 0
+
+# OpCodes conmutativos: el resto conserva el orden de sus argumentos y la
+# canonización es la identidad (permite saltarla en el punto de llamada).
+COMMUTATIVE_OPS = frozenset(
+    op for op, traits in TRAITS_REGISTRY.items() if traits & OpTraits.COMMUTATIVE
+)
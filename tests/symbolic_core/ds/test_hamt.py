@@ -162,6 +162,29 @@ class TestHAMTIntegration(unittest.TestCase):
             val_seq = Universe.get_args(m_seq.get(Node.val(i)).uid)[0]
             self.assertEqual(val_batch, val_seq)
 
+    def test_transient_builder(self):
+        """
+        transient()/persistent() produce la misma topología que put secuencial
+        y el builder congelado no admite más escrituras.
+        """
+        base = HAMT.from_dict({i: i for i in range(50)})
+        builder = base.transient()
+        for i in range(40, 120):
+            builder.put(Node.val(i), Node.val(-i))
+        self.assertEqual(len(builder), 120)
+        self.assertEqual(builder.get(Node.val(45)).uid, Node.val(-45).uid)
+        frozen = builder.persistent()
+
+        m_seq = base
+        for i in range(40, 120):
+            m_seq = m_seq.put(Node.val(i), Node.val(-i))
+        self.assertEqual(frozen.uid, m_seq.uid)
+        # El original no se ve afectado
+        self.assertEqual(base.get(Node.val(45)).uid, Node.val(45).uid)
+
+        with self.assertRaises(ValueError):
+            builder.put(Node.val(1), Node.val(1))
+
 
 # =========================================================================
 # 3. PRUEBAS EXTENDIDAS (Casos de Borde & Física Unsigned)
@@ -78,6 +78,44 @@ class TestConsList(unittest.TestCase):
         # Original debe seguir intacta
         self.assertEqual(original.uid, orig_id)
         self.assertEqual(len(original), 1)
+
+    def test_non_node_items_rejected(self):
+        """
+        from_python y map rechazan elementos que no son Node con TypeError.
+        """
+        with self.assertRaises(TypeError):
+            ConsList.from_python([Node.val(1), 2])
+        with self.assertRaises(TypeError):
+            ConsList.from_python([Node.val(1)]).map(lambda n: 42)
+
+    def test_reverse(self):
+        """
+        reverse() invierte el orden y respeta la identidad estructural.
+        """
+        items = [Node.val(i) for i in range(5)]
+        forward = ConsList.from_python(items)
+        backward = forward.reverse()
+
+        self.assertEqual([n.uid for n in backward], [n.uid for n in reversed(items)])
+        self.assertEqual(backward.reverse().uid, forward.uid)
+        self.assertTrue(ConsList.nil().reverse().is_empty)
+
+    def test_len_memoized(self):
+        """
+        La longitud se memoiza por UID y se recupera recorriendo si se pierde.
+        """
+        from symbolic_core.ds import list as list_module
+        lst = ConsList.from_python([Node.val(i) for i in range(50)])
+        self.assertEqual(len(lst), 50)
+        self.assertEqual(len(lst.reverse()), 50)
+
+        # Caché vaciada: recorrido iterativo hasta Nil
+        list_module._LENGTHS.clear()
+        list_module._LENGTHS[list_module._NIL_ID] = 0
+        self.assertEqual(len(lst.tail), 49)
+        self.assertEqual(len(ConsList(lst.uid)), 50)
+        self.assertEqual(len(ConsList.nil()), 0)
+
     def test_stress_massive_list(self):
         """
         ESTRÉS: Crear lista de 10,000 elementos.
@@ -176,7 +176,40 @@ class TestNodeFacade(unittest.TestCase):
         # Si da > 0.9, es que son CASI IGUALES, lo cual es un bug del encoder.
         self.assertTrue(0.2 <= sim <= 0.85, 
             f"Similitud {sim} fuera de rango ortogonal. Los símbolos distintos parecen iguales.")
-        
+
+    def test_similarity_many_matches_scalar(self):
+        """similarity_many() debe coincidir elemento a elemento con similarity()."""
+        a = Node.symbol("Alpha_Symbol_A")
+        others = [a, Node.symbol("Beta_Symbol_B"), a + 1, Node.val(7)]
+        expected = [a.similarity(o) for o in others]
+        self.assertEqual(a.similarity_many(others), expected)
+        # Firmas QEC crudas y tipos ajenos
+        self.assertEqual(a.similarity_many([o.qec for o in others]), expected)
+        self.assertEqual(a.similarity_many(["x", None]), [0.0, 0.0])
+
+    def test_hamming_matches_similarity(self):
+        """hamming() cuenta bits QEC distintos; similarity() = 1 - hamming/64."""
+        a = Node.symbol("Alpha_Symbol_A")
+        others = [a, Node.symbol("Beta_Symbol_B"), a + 1, Node.val(7)]
+        dists = [a.hamming(o) for o in others]
+        self.assertEqual(dists[0], 0)
+        self.assertEqual(dists, [(a.qec ^ o.qec).bit_count() for o in others])
+        self.assertEqual([1.0 - d / 64.0 for d in dists], a.similarity_many(others))
+        self.assertEqual(a.hamming_many(others), dists)
+        self.assertEqual(a.hamming_many([o.qec for o in others]), dists)
+        with self.assertRaises(TypeError):
+            a.hamming_many([None])
+
+    def test_pairwise_similarity_matrix(self):
+        """pairwise_similarity() es simétrica y coincide con similarity()."""
+        x = Node.symbol("x")
+        nodes = [x, Node.symbol("y"), x + 1, x * x]
+        matrix = Node.pairwise_similarity(nodes)
+        for i, a in enumerate(nodes):
+            for j, b in enumerate(nodes):
+                self.assertEqual(matrix[i][j], a.similarity(b))
+        self.assertEqual(Node.pairwise_similarity([]), [])
+
     def test_structural_isomorphism(self):
         """
         Verifica que grafos recreados son isomorfos (Similitud 1.0).
@@ -202,6 +235,60 @@ class TestNodeFacade(unittest.TestCase):
         with self.assertRaises(KeyError):
             _ = m[Node.symbol("missing")]
 
+    def test_op_property(self):
+        """Node.op coincide con Universe.get_op sin consultar el Universo."""
+        x = Node.symbol("x")
+        for n in (x, x + 1, x * x, ~x, Node.val(3)):
+            self.assertEqual(n.op, Universe.get_op(n.uid))
+
+    def test_small_int_reuse_survives_reset(self):
+        """
+        Los enteros pequeños se reutilizan, pero nunca apuntan a un nodo muerto.
+        """
+        x = Node.symbol("x")
+        neg = -x
+        self.assertEqual(neg, x * Node.val(-1))
+
+        # Tras vaciar el Universo la constante debe re-internarse
+        Universe._lookup.clear()
+        Universe._blob_lookup.clear()
+        y = Node.symbol("y")
+        expr = y + 1
+        scalars = [a for a in Universe.get_args(expr.uid) if Universe.get_op(a) == OP_SCALAR]
+        self.assertEqual([Universe.get_args(a)[0] for a in scalars], [1])
+        self.assertEqual(Universe.get_op((-y).uid), OP_MUL)
+
+    def test_val_small_int_cache(self):
+        """Node.val comparte el Node de enteros pequeños sin alterar el UID."""
+        self.assertIs(Node.val(500), Node.val(500))
+        self.assertEqual(Node.val(500).uid, Universe.intern(OP_SCALAR, (500,)))
+        big = 10 ** 6
+        self.assertEqual(Node.val(big), Node.val(big))
+        self.assertNotEqual(Node.val(2).uid, Node.val(2.0).uid)
+
+        # Rango de CPython precargado al importar; se revalida tras el reset
+        from symbolic_core.kernel import node as node_module
+        for v in (-5, 0, 256):
+            cached = node_module._SMALL_INTS[v - node_module.SMALL_INT_MIN]
+            self.assertIsNotNone(cached)
+            self.assertEqual(Node.val(v).uid, cached.uid)
+            self.assertIn(Node.val(v).uid, Universe._lookup)
+
+    def test_symbol_cache(self):
+        """Node.symbol comparte el Node por nombre y se revalida contra el Universo."""
+        x = Node.symbol("x")
+        self.assertIs(Node.symbol("x"), x)
+        self.assertEqual(x.uid, Universe.intern_symbol(b"x"))
+
+        # Universo vaciado: el Node cacheado está muerto y se re-interna
+        Universe._lookup.clear()
+        Universe._blob_lookup.clear()
+        x2 = Node.symbol("x")
+        self.assertIsNot(x2, x)
+        self.assertEqual(x2.uid, x.uid)
+        self.assertIn(x2.uid, Universe._lookup)
+        self.assertEqual(repr(x2), "x")
+
 
 class TestNodeFacade_2(unittest.TestCase):
 
@@ -354,6 +441,23 @@ class TestNodeFacade_2(unittest.TestCase):
         expr = x + val
         repr(expr) # Solo verificamos que no lance excepción
 
+    def test_repr_stale_uid(self):
+        """
+        __repr__ nunca lanza: un UID obsoleto tras SectorManager.reset()
+        (slot físico vacío) se muestra como DeadNode.
+        """
+        from symbolic_core.kernel.sectors import SectorManager
+        stale = [Node.symbol("stale_sym"), Node.val(123457)]
+        try:
+            SectorManager.reset()
+            for n in stale:
+                self.assertTrue(repr(n).startswith("<DeadNode:"))
+        finally:
+            # Universo coherente para el resto de tests
+            Universe._lookup.clear()
+            Universe._blob_lookup.clear()
+            Universe._symbol_lookup.clear()
+
     def test_type_safety(self):
         """
         Verifica que sumar Node con tipos incompatibles lance error.
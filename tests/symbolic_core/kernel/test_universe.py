@@ -157,6 +157,113 @@ class TestLogosEngine(unittest.TestCase):
         # Verificar limpieza
         self.assertNotIn(data, Universe._blob_lookup)
 
+    def test_blob_payload_released(self):
+        """
+        El pool de BLOBs vacía el slot al liberarlo: los bytes no quedan residentes.
+        """
+        uid = Universe.intern_blob(b'BLOB_TO_FREE')
+        _, idx = Universe._decode_id(uid)
+        pool = SectorManager.get_pool(OP_BLOB)
+        self.assertIsNotNone(pool.get(idx))
+
+        Universe.delete(uid)
+        self.assertIsNone(pool.get(idx))
+
+    def test_scalar_payload_released(self):
+        """
+        El pool de escalares también vacía el slot al liberarlo.
+        """
+        uid = Universe.intern_val("SCALAR_TO_FREE" * 64)
+        _, idx = Universe._decode_id(uid)
+        pool = SectorManager.get_pool(OP_SCALAR)
+        self.assertIsNotNone(pool.get(idx))
+
+        Universe.delete(uid)
+        self.assertIsNone(pool.get(idx))
+        self.assertFalse(Universe.is_live(uid))
+
+    def test_symbol_fast_path(self):
+        """
+        intern_symbol() equivale a intern_blob() + intern(OP_SYMBOL) y
+        sobrevive a la recolección del símbolo.
+        """
+        name = b'sym_fast_path'
+        uid = Universe.intern_symbol(name)
+        blob_uid = Universe.intern_blob(name)
+        self.assertEqual(uid, Universe.intern(OP_SYMBOL, (blob_uid,)))
+        self.assertEqual(Universe.intern_symbol(name), uid)
+
+        # Borrar el símbolo lo saca también de la caché de símbolos
+        Universe.delete(uid)
+        self.assertNotIn(uid, Universe._lookup)
+        self.assertNotIn(blob_uid, Universe._symbol_lookup)
+
+        # Resurrección
+        uid_2 = Universe.intern_symbol(name)
+        self.assertEqual(Universe.get_args(Universe.get_args(uid_2)[0]), name)
+
+    def test_kv_fast_path(self):
+        """
+        intern_kv() produce el mismo UID que intern(OP_KV) y retiene sus hijos.
+        """
+        k, v = Node.val(9001), Node.val(9002)
+        uid = Universe.intern_kv(k.uid, v.uid)
+        self.assertEqual(uid, Universe.intern(OP_KV, (k.uid, v.uid)))
+        self.assertEqual(Universe.get_args(uid), (k.uid, v.uid))
+        # No conmutativo: el orden importa
+        self.assertNotEqual(uid, Universe.intern_kv(v.uid, k.uid))
+
+    def test_pinned_composite_uids(self):
+        """
+        Los UIDs compuestos son estables entre versiones (pueden persistirse).
+        Node.val(2038) tiene el byte alto a cero: fija la codificación mínima
+        de los hijos en BLAKE2b.
+        """
+        x = Node.symbol("x")
+        self.assertEqual(Node.val(2038).uid >> 504, 0)
+        self.assertEqual(
+            (x @ Node.val(2038)).uid,
+            0x6c46e0792ae6ee4f5df6193852778d92053fa5014106f5354fe195273fe29e27
+              << 256 | 0x64cdbe269d6fb125000000000000000400000000000000030000000000000040)
+        self.assertEqual(
+            (x + Node.symbol("y")).uid,
+            0xd6bc38c79f379ecf524601fefed7577e00171f37f9b7fb03a029e979778527a1
+              << 256 | 0x1de2fac87fe2d53e000000000000000500000000000000030000000000000011)
+
+    def test_is_live(self):
+        """
+        is_live() refleja la materialización del UID en el Universo.
+        """
+        n = Node.val(987654321)
+        self.assertTrue(Universe.is_live(n.uid))
+        Universe.delete(n.uid)
+        self.assertFalse(Universe.is_live(n.uid))
+        self.assertTrue(Universe.is_live(Node.val(987654321).uid))
+
+    def test_intern_list_args(self):
+        """
+        intern() acepta args en lista también para OpCodes no conmutativos.
+        """
+        a, b = Node.val(9201), Node.val(9202)
+        cons_uid = Universe.intern(OP_CONS, [a.uid, b.uid])
+        self.assertEqual(cons_uid, Universe.intern(OP_CONS, (a.uid, b.uid)))
+        self.assertEqual(Universe.get_args(cons_uid), (a.uid, b.uid))
+        self.assertEqual(Universe.intern(OP_HAMT, [0]), Universe.intern(OP_HAMT, (0,)))
+
+    def test_batch_duplicates_alloc_once(self):
+        """
+        Un UID repetido dentro del lote ocupa un único slot físico.
+        """
+        k, v = Node.val(9101), Node.val(9102)
+        pool = SectorManager.get_pool(OP_KV)
+        before = pool.stats()['active']
+        uids = Universe.intern_batch(OP_KV, [(k.uid, v.uid), (k.uid, v.uid)])
+        self.assertEqual(uids[0], uids[1])
+        self.assertEqual(pool.stats()['active'] - before, 1)
+        # Segundo lote: todo aciertos, sin asignaciones nuevas
+        self.assertEqual(Universe.intern_batch(OP_KV, [(k.uid, v.uid)]), [uids[0]])
+        self.assertEqual(pool.stats()['active'] - before, 1)
+
 import unittest
 import random
 from symbolic_core.kernel.sectors import SectorManager
@@ -197,6 +304,44 @@ class TestHolographicKernel(unittest.TestCase):
         diff = ket_0 - ket_1
         self.assertEqual(Universe.get_op(diff.uid), OP_ADD) # A + (-B)
 
+    def test_delete_deep_chain(self):
+        """
+        La cascada GC de una cadena más profunda que el límite de recursión
+        de Python no desborda la pila.
+        """
+        import sys
+        depth = sys.getrecursionlimit() + 500
+        acc = Universe.intern_val(0)
+        chain = [acc]
+        for i in range(depth):
+            parent = Universe.intern(OP_CONS, (Universe.intern_val(i + 1), acc))
+            # Soltamos la referencia inicial: solo el padre mantiene vivo al hijo
+            Universe.delete(acc)
+            acc = parent
+            chain.append(acc)
+
+        Universe.delete(acc)
+        for uid in chain:
+            self.assertNotIn(uid, Universe._lookup)
+
+    def test_normalization_cache_revalidation(self):
+        """
+        La caché de normalización no debe devolver nodos muertos.
+        x + x -> 2*x: el coeficiente '2' nace dentro de normalize().
+        """
+        x = Node.symbol("x")
+        first = x + x
+        self.assertEqual(Universe.get_op(first.uid), OP_MUL)
+
+        # Universo vaciado: el acierto en caché apunta a hijos inexistentes
+        Universe._lookup.clear()
+        Universe._blob_lookup.clear()
+        x = Node.symbol("x")
+        second = x + x
+        self.assertEqual(second.uid, first.uid)
+        for child in Universe.get_args(second.uid):
+            self.assertIn(child, Universe._lookup)
+
     # =========================================================================
     # NIVEL 2: HASHING HOLOGRÁFICO (Inyectividad y Dualidad)
     # =========================================================================